@@ -6,22 +6,79 @@ sandoc — AI-powered Korean government business plan (사업계획서) generato
 
 __version__ = "0.1.0"
 
-from sandoc.parser import parse_hwp, parse_pdf, parse_any
-from sandoc.analyzer import analyze_template, analyze_announcement, classify_documents
-from sandoc.style import StyleProfile, extract_style_profile, load_style_profile
-from sandoc.schema import CompanyInfo, create_sample_company
-from sandoc.generator import PlanGenerator, GeneratedSection, GeneratedPlan
-from sandoc.hwpx_engine import HwpxBuilder, StyleMirror, validate_hwpx, edit_hwpx_text
-from sandoc.output import OutputPipeline, BuildResult, build_hwpx_from_plan, build_hwpx_from_json
-from sandoc.extract import run_extract
-from sandoc.assemble import run_assemble
-from sandoc.visualize import run_visualize
-from sandoc.review import run_review
-from sandoc.profile_register import run_profile_register
-from sandoc.interview import run_interview
-from sandoc.learn import run_learn
-from sandoc.inject import run_inject
-from sandoc.run import run_pipeline
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sandoc.parser import parse_hwp, parse_pdf, parse_any
+    from sandoc.analyzer import analyze_template, analyze_announcement, classify_documents
+    from sandoc.style import StyleProfile, extract_style_profile, load_style_profile
+    from sandoc.schema import CompanyInfo, create_sample_company
+    from sandoc.generator import PlanGenerator, GeneratedSection, GeneratedPlan
+    from sandoc.hwpx_engine import HwpxBuilder, StyleMirror, validate_hwpx, edit_hwpx_text
+    from sandoc.output import OutputPipeline, BuildResult, build_hwpx_from_plan, build_hwpx_from_json
+    from sandoc.extract import run_extract
+    from sandoc.assemble import run_assemble
+    from sandoc.visualize import run_visualize
+    from sandoc.review import run_review
+    from sandoc.profile_register import run_profile_register
+    from sandoc.interview import run_interview
+    from sandoc.learn import run_learn
+    from sandoc.inject import run_inject
+    from sandoc.run import run_pipeline
+
+# 공개 이름 → 정의 모듈. `import sandoc` (또는 sandoc.run 등 하위 모듈 import) 만으로
+# 파서·HWPX 엔진 등 모든 하위 모듈이 로드되지 않도록, 이름에 처음 접근할 때
+# 해당 모듈만 가져옵니다 (PEP 562 모듈 __getattr__).
+_EXPORTS: dict[str, str] = {
+    "parse_hwp": "sandoc.parser",
+    "parse_pdf": "sandoc.parser",
+    "parse_any": "sandoc.parser",
+    "analyze_template": "sandoc.analyzer",
+    "analyze_announcement": "sandoc.analyzer",
+    "classify_documents": "sandoc.analyzer",
+    "StyleProfile": "sandoc.style",
+    "extract_style_profile": "sandoc.style",
+    "load_style_profile": "sandoc.style",
+    "CompanyInfo": "sandoc.schema",
+    "create_sample_company": "sandoc.schema",
+    "PlanGenerator": "sandoc.generator",
+    "GeneratedSection": "sandoc.generator",
+    "GeneratedPlan": "sandoc.generator",
+    "HwpxBuilder": "sandoc.hwpx_engine",
+    "StyleMirror": "sandoc.hwpx_engine",
+    "validate_hwpx": "sandoc.hwpx_engine",
+    "edit_hwpx_text": "sandoc.hwpx_engine",
+    "OutputPipeline": "sandoc.output",
+    "BuildResult": "sandoc.output",
+    "build_hwpx_from_plan": "sandoc.output",
+    "build_hwpx_from_json": "sandoc.output",
+    "run_extract": "sandoc.extract",
+    "run_assemble": "sandoc.assemble",
+    "run_visualize": "sandoc.visualize",
+    "run_review": "sandoc.review",
+    "run_profile_register": "sandoc.profile_register",
+    "run_interview": "sandoc.interview",
+    "run_learn": "sandoc.learn",
+    "run_inject": "sandoc.inject",
+    "run_pipeline": "sandoc.run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """공개 이름에 처음 접근할 때 정의 모듈을 import 하여 반환."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # 다음 접근부터는 일반 속성 조회
+    return value
+
+
+def __dir__() -> list[str]:
+    """아직 로드하지 않은 공개 이름도 dir() 에 나오도록 포함."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # parser
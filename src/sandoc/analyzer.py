@@ -179,12 +179,13 @@ DATE_PATTERNS = [
 ]
 
 
-def analyze_announcement(path: str | Path) -> AnnouncementAnalysis:
+def analyze_announcement(path: str | Path, *, workers: int = 1) -> AnnouncementAnalysis:
     """
     PDF 공고문을 분석하여 평가 기준, 주요 일정, 자격 요건을 추출합니다.
 
     Args:
         path: PDF 공고문 파일 경로
+        workers: PDF 페이지 병렬 파싱 프로세스 수 (parse_pdf 참고)
 
     Returns:
         AnnouncementAnalysis: 공고문 분석 결과
@@ -193,7 +194,7 @@ def analyze_announcement(path: str | Path) -> AnnouncementAnalysis:
     result = AnnouncementAnalysis(file_path=str(path))
 
     # PDF 파싱
-    parsed = parse_pdf(path)
+    parsed = parse_pdf(path, workers=workers)
     result.total_pages = parsed.page_count
     full_text = parsed.full_text
 
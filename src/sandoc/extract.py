@@ -55,12 +55,13 @@ REQUIRED_COMPANY_FIELDS = [
 ]
 
 
-def run_extract(project_dir: Path) -> dict[str, Any]:
+def run_extract(project_dir: Path, *, workers: int = 1) -> dict[str, Any]:
     """
     프로젝트 폴더에서 모든 정보를 추출합니다.
 
     Args:
         project_dir: 프로젝트 루트 디렉토리 (docs/ 하위 폴더 필요)
+        workers: 공고문 PDF 페이지 병렬 파싱 프로세스 수 (추출 시간의 대부분)
 
     Returns:
         {
@@ -150,7 +151,7 @@ def run_extract(project_dir: Path) -> dict[str, Any]:
         logger.info("공고문 분석 중: %s", best_announcement.filename)
 
         try:
-            aa = analyze_announcement(best_announcement.file_path)
+            aa = analyze_announcement(best_announcement.file_path, workers=workers)
             context["announcement_analysis"] = {
                 "file": best_announcement.filename,
                 "title": aa.title,
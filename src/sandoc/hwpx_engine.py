@@ -15,7 +15,6 @@ HWPX(ZIP 패키지) 문서를 직접 생성·편집하여,
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 import shutil
@@ -26,6 +25,8 @@ from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
 
+from sandoc.jsonio import load_json
+
 logger = logging.getLogger(__name__)
 
 # ── hwpx-mcp-server 가용성 확인 ──────────────────────────────────
@@ -59,6 +60,9 @@ PT_TO_HWPUNIT = 100  # 폰트 크기: pt × 100
 class StyleMirror:
     """
     style-profile.json 에서 읽은 서식을 HWPX XML 속성으로 변환합니다.
+
+    파싱된 원본 프로파일 dict 는 ``profile`` 속성으로 공유되므로,
+    같은 파일을 다시 읽지 않고 재사용할 수 있습니다.
     """
 
     def __init__(self, profile: dict[str, Any] | None = None):
@@ -75,8 +79,7 @@ class StyleMirror:
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"스타일 프로파일 파일 없음: {path}")
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls(data)
+        return cls(load_json(path))
 
     @classmethod
     def default(cls) -> StyleMirror:
@@ -10,14 +10,27 @@ sandoc.inject — HWP 템플릿 삽입 매핑 (HWP Template Injection Mapping)
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 import re
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import load_json
+
 logger = logging.getLogger(__name__)
 
+# 섹션 제목 정규화: 공백(유니코드 공백 포함) + 글머리 기호 제거용 변환 테이블
+_NORM_CHARS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+    "□■◆●○"
+)
+_NORM_TABLE = str.maketrans("", "", _NORM_CHARS)
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
 # ── 섹션 → 양식 매핑 테이블 (창업도약패키지 기준) ────────────────────
 
 TEMPLATE_SECTION_MAP: list[dict[str, Any]] = [
@@ -183,7 +196,7 @@ def run_inject(
     template_info: dict[str, Any] = {}
     if context_path.exists():
         try:
-            ctx = json.loads(context_path.read_text(encoding="utf-8"))
+            ctx = load_json(context_path)
             template_info = ctx.get("template_analysis", {}) or {}
         except (json.JSONDecodeError, OSError):
             pass
@@ -266,15 +279,15 @@ def _build_injection_map(
 def _section_title_match(expected: str, actual: str) -> bool:
     """양식 섹션 제목이 매칭되는지 확인합니다."""
     # 공백, 특수문자 제거 후 비교
-    norm_expected = re.sub(r"[\s□■◆●○]", "", expected)
-    norm_actual = re.sub(r"[\s□■◆●○]", "", actual)
+    norm_expected = expected.translate(_NORM_TABLE)
+    norm_actual = actual.translate(_NORM_TABLE)
 
     # 부분 매칭
     if norm_expected in norm_actual or norm_actual in norm_expected:
         return True
 
     # 키워드 매칭
-    keywords = re.findall(r"[가-힣]+", expected)
+    keywords = _HANGUL_RE.findall(expected)
     if keywords:
         matches = sum(1 for kw in keywords if kw in actual)
         return matches >= len(keywords) // 2
@@ -288,84 +301,87 @@ def _build_injection_instructions(
     template_file: str,
 ) -> str:
     """Claude Code 용 삽입 지시서를 생성합니다."""
-    lines = [
-        "# 📝 HWP 템플릿 삽입 지시서",
-        "",
-        f"**프로젝트:** {project_name}",
-        f"**대상 양식:** {template_file}",
-        f"**총 매핑 수:** {len(mappings)}개",
-        "",
-        "---",
-        "",
-        "## 사전 요구사항",
-        "",
-        "1. `hwpx-mcp` MCP 서버가 실행 중이어야 합니다",
-        "2. 원본 HWP 양식 파일이 프로젝트 `docs/` 폴더에 있어야 합니다",
-        "3. 아래 매핑을 순서대로 처리하세요",
-        "",
-        "---",
-        "",
-        "## 삽입 절차",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# 📝 HWP 템플릿 삽입 지시서\n"
+        "\n"
+        f"**프로젝트:** {project_name}\n"
+        f"**대상 양식:** {template_file}\n"
+        f"**총 매핑 수:** {len(mappings)}개\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## 사전 요구사항\n"
+        "\n"
+        "1. `hwpx-mcp` MCP 서버가 실행 중이어야 합니다\n"
+        "2. 원본 HWP 양식 파일이 프로젝트 `docs/` 폴더에 있어야 합니다\n"
+        "3. 아래 매핑을 순서대로 처리하세요\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## 삽입 절차\n"
+        "\n"
+    )
 
     for i, mapping in enumerate(mappings, 1):
-        lines.append(f"### {i}. {mapping['template_section']}")
-        lines.append("")
-        lines.append(f"- **초안 파일:** `output/drafts/current/{mapping['draft_file']}`")
-        lines.append(f"- **삽입 유형:** `{mapping['injection_type']}`")
-        lines.append(f"- **설명:** {mapping['description']}")
-        lines.append("")
+        template_section = mapping["template_section"]
+        w(f"### {i}. {template_section}\n")
+        w("\n")
+        w(f"- **초안 파일:** `output/drafts/current/{mapping['draft_file']}`\n")
+        w(f"- **삽입 유형:** `{mapping['injection_type']}`\n")
+        w(f"- **설명:** {mapping['description']}\n")
+        w("\n")
 
         # 삽입 유형별 상세 지시
         injection_type = mapping["injection_type"]
         markers = mapping["target_markers"]
 
         if injection_type == "text_replace":
-            lines.append("**작업 절차:**")
-            lines.append("```")
-            lines.append(f"1. hwpx-mcp로 양식에서 '{mapping['template_section']}' 섹션을 찾습니다")
-            lines.append("2. 다음 마커 위치의 텍스트를 초안 파일의 해당 값으로 교체합니다:")
+            w("**작업 절차:**\n")
+            w("```\n")
+            w(f"1. hwpx-mcp로 양식에서 '{template_section}' 섹션을 찾습니다\n")
+            w("2. 다음 마커 위치의 텍스트를 초안 파일의 해당 값으로 교체합니다:\n")
             for marker in markers:
-                lines.append(f"   - {marker} → (초안에서 추출)")
-            lines.append("```")
+                w(f"   - {marker} → (초안에서 추출)\n")
+            w("```\n")
         elif injection_type == "section_content":
-            lines.append("**작업 절차:**")
-            lines.append("```")
-            lines.append(f"1. hwpx-mcp로 양식에서 '{mapping['template_section']}' 섹션을 찾습니다")
-            lines.append("2. 해당 섹션의 빈 영역에 초안 파일의 내용을 삽입합니다")
-            lines.append("3. 양식의 서식(폰트, 크기, 줄간격)을 유지합니다")
-            lines.append("4. 다음 하위 항목을 순서대로 배치합니다:")
+            w("**작업 절차:**\n")
+            w("```\n")
+            w(f"1. hwpx-mcp로 양식에서 '{template_section}' 섹션을 찾습니다\n")
+            w("2. 해당 섹션의 빈 영역에 초안 파일의 내용을 삽입합니다\n")
+            w("3. 양식의 서식(폰트, 크기, 줄간격)을 유지합니다\n")
+            w("4. 다음 하위 항목을 순서대로 배치합니다:\n")
             for marker in markers:
-                lines.append(f"   - {marker}")
-            lines.append("```")
+                w(f"   - {marker}\n")
+            w("```\n")
         elif injection_type == "table_and_content":
-            lines.append("**작업 절차:**")
-            lines.append("```")
-            lines.append(f"1. hwpx-mcp로 양식에서 '{mapping['template_section']}' 섹션을 찾습니다")
-            lines.append("2. 표 데이터를 먼저 삽입합니다 (마크다운 표 → HWP 표)")
-            lines.append("3. 표 아래/위의 서술 내용을 삽입합니다")
-            lines.append("4. 다음 필드를 포함해야 합니다:")
+            w("**작업 절차:**\n")
+            w("```\n")
+            w(f"1. hwpx-mcp로 양식에서 '{template_section}' 섹션을 찾습니다\n")
+            w("2. 표 데이터를 먼저 삽입합니다 (마크다운 표 → HWP 표)\n")
+            w("3. 표 아래/위의 서술 내용을 삽입합니다\n")
+            w("4. 다음 필드를 포함해야 합니다:\n")
             for marker in markers:
-                lines.append(f"   - {marker}")
-            lines.append("```")
+                w(f"   - {marker}\n")
+            w("```\n")
 
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        w("\n")
+        w("---\n")
+        w("\n")
 
     # 마무리 확인사항
-    lines.extend([
-        "## 마무리 확인사항",
-        "",
-        "- [ ] 모든 섹션이 올바른 위치에 삽입되었는지 확인",
-        "- [ ] 양식의 서식(폰트, 크기, 줄간격)이 유지되는지 확인",
-        "- [ ] 표의 행/열이 올바르게 채워졌는지 확인",
-        "- [ ] 빈 필드가 없는지 확인",
-        "- [ ] 페이지 넘침이 없는지 확인",
-        "- [ ] 최종 HWPX 파일을 한글(HWP)에서 열어 육안 검토",
-        "",
-        f"> 이 지시서는 `sandoc inject {project_name}` 으로 자동 생성되었습니다.",
-    ])
-
-    return "\n".join(lines)
+    w(
+        "## 마무리 확인사항\n"
+        "\n"
+        "- [ ] 모든 섹션이 올바른 위치에 삽입되었는지 확인\n"
+        "- [ ] 양식의 서식(폰트, 크기, 줄간격)이 유지되는지 확인\n"
+        "- [ ] 표의 행/열이 올바르게 채워졌는지 확인\n"
+        "- [ ] 빈 필드가 없는지 확인\n"
+        "- [ ] 페이지 넘침이 없는지 확인\n"
+        "- [ ] 최종 HWPX 파일을 한글(HWP)에서 열어 육안 검토\n"
+        "\n"
+        f"> 이 지시서는 `sandoc inject {project_name}` 으로 자동 생성되었습니다."
+    )
+
+    return buf.getvalue()
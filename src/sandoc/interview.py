@@ -10,11 +10,14 @@ missing_info.json 을 읽어서:
 
 from __future__ import annotations
 
+import io
 import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import load_json
+
 logger = logging.getLogger(__name__)
 
 # ── 필드 메타데이터: 카테고리, 한국어 이름, 설명, 예시 ─────────────
@@ -408,8 +411,8 @@ def _fill_answers(
         return result
 
     try:
-        context = json.loads(context_path.read_text(encoding="utf-8"))
-        answers = json.loads(fill_path.read_text(encoding="utf-8"))
+        context = load_json(context_path)
+        answers = load_json(fill_path)
     except (json.JSONDecodeError, OSError) as e:
         result["errors"].append(f"JSON 읽기 실패: {e}")
         return result
@@ -457,45 +460,42 @@ def _fill_answers(
 
 def _group_by_category(fields: list[str]) -> dict[str, list[str]]:
     """필드 목록을 카테고리별로 그룹핑합니다."""
-    grouped: dict[str, list[str]] = {}
+    # 카테고리 순서대로 미리 채워 두고, 그 외 카테고리(기타 등)는 뒤에 붙입니다
+    ordered: dict[str, list[str]] = {cat: [] for cat in CATEGORY_ORDER}
+    residuals: dict[str, list[str]] = {}
     for f in fields:
-        meta = FIELD_METADATA.get(f, {})
-        cat = meta.get("category", "기타")
-        if cat not in grouped:
-            grouped[cat] = []
-        grouped[cat].append(f)
-
-    # 카테고리 순서 정렬
-    ordered: dict[str, list[str]] = {}
-    for cat in CATEGORY_ORDER:
-        if cat in grouped:
-            ordered[cat] = grouped.pop(cat)
-    # 나머지 (기타 등)
-    for cat, fields_list in grouped.items():
-        ordered[cat] = fields_list
+        cat = FIELD_METADATA.get(f, {}).get("category", "기타")
+        bucket = ordered.get(cat)
+        if bucket is None:
+            bucket = residuals.setdefault(cat, [])
+        bucket.append(f)
 
-    return ordered
+    grouped = {cat: fs for cat, fs in ordered.items() if fs}
+    grouped.update(residuals)
+    return grouped
 
 
 def _build_questionnaire_md(
     grouped: dict[str, list[str]], project_name: str
 ) -> str:
     """카테고리별 설문지 마크다운을 생성합니다."""
-    lines = [
-        f"# 📋 사업계획서 정보 수집 설문지",
-        f"",
-        f"**프로젝트:** {project_name}",
-        f"",
-        f"아래 항목들은 문서에서 자동 추출되지 않아 직접 입력이 필요합니다.",
-        f"작성 후 `output/company_info_template.json` 파일을 채워서 제출하세요.",
-        f"",
-        f"---",
-        f"",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# 📋 사업계획서 정보 수집 설문지\n"
+        "\n"
+        f"**프로젝트:** {project_name}\n"
+        "\n"
+        "아래 항목들은 문서에서 자동 추출되지 않아 직접 입력이 필요합니다.\n"
+        "작성 후 `output/company_info_template.json` 파일을 채워서 제출하세요.\n"
+        "\n"
+        "---\n"
+        "\n"
+    )
 
     for cat, fields in grouped.items():
-        lines.append(f"## {cat}")
-        lines.append("")
+        w(f"## {cat}\n")
+        w("\n")
 
         for f in fields:
             meta = FIELD_METADATA.get(f, {})
@@ -503,18 +503,19 @@ def _build_questionnaire_md(
             desc = meta.get("description", "")
             example = meta.get("example", "")
 
-            lines.append(f"### {label}")
+            w(f"### {label}\n")
             if desc:
-                lines.append(f"  {desc}")
+                w(f"  {desc}\n")
             if example:
-                lines.append(f"  - 예시: `{example}`")
-            lines.append(f"  - **입력:** ____________________")
-            lines.append("")
+                w(f"  - 예시: `{example}`\n")
+            w("  - **입력:** ____________________\n")
+            w("\n")
 
-        lines.append("---")
-        lines.append("")
+        w("---\n")
+        w("\n")
 
-    return "\n".join(lines)
+    # 끝의 빈 줄 하나는 제외합니다
+    return buf.getvalue()[:-1]
 
 
 def _build_json_template(grouped: dict[str, list[str]]) -> dict[str, Any]:
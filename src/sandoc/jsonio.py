@@ -0,0 +1,111 @@
+"""
+sandoc.jsonio — JSON 입출력 헬퍼
+
+orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 폴백합니다.
+orjson 은 bytes 를 직접 파싱하므로 str 디코딩 단계를 건너뜁니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 은 선택 의존성
+    orjson = None  # type: ignore[assignment]
+
+# 표준 json 스트리밍 저장 시 파일 버퍼 크기
+_WRITE_BUFFER = 1 << 20
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON bytes/str 를 파싱합니다.
+
+    파싱 실패 시 json.JSONDecodeError (orjson.JSONDecodeError 는 하위 클래스) 를 발생시킵니다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path) -> Any:
+    """JSON 파일을 읽어 파싱합니다."""
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj: Any, *, indent: bool = True) -> bytes:
+    """객체를 UTF-8 JSON bytes 로 직렬화합니다.
+
+    indent=True 이면 json.dumps(obj, ensure_ascii=False, indent=2) 와 같은 형식,
+    False 이면 공백 없는 한 줄 형식 (separators=(",", ":")) 입니다.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """객체를 한 줄짜리 JSON bytes (끝에 개행 포함) 로 직렬화합니다 (JSON Lines 용)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def dump_json(
+    path: Path,
+    obj: Any,
+    *,
+    atomic: bool = False,
+    skip_unchanged: bool = False,
+    indent: bool = True,
+) -> None:
+    """객체를 JSON 파일로 저장합니다.
+
+    중간 str 을 만들지 않고 파일에 바로 씁니다 (orjson: bytes 1회 쓰기,
+    표준 json: json.dump 로 청크 단위 스트리밍). 표준 json 은 작은 조각을 많이
+    쓰므로 1 MiB 버퍼로 write 시스템 호출 수를 줄입니다.
+
+    atomic=True 이면 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace 로 교체하여,
+    중간에 중단되어도 기존 파일이 반쯤 쓰인 JSON 으로 남지 않습니다.
+
+    skip_unchanged=True 이면 직렬화 결과가 기존 파일 내용과 같을 때 쓰지 않습니다
+    (크기가 다르면 파일을 읽지 않고 바로 씀). 비교를 위해 bytes 를 먼저 만듭니다.
+
+    indent=False 이면 들여쓰기 없이 압축된 JSON 으로 저장합니다.
+    """
+    path = Path(path)
+    data: bytes | None = None
+    if skip_unchanged:
+        data = dumps(obj, indent=indent)
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+
+    target = path.with_name(path.name + ".tmp") if atomic else path
+    try:
+        if data is None and orjson is not None:
+            data = dumps(obj, indent=indent)
+        if data is not None:
+            target.write_bytes(data)
+        else:
+            with target.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+                if indent:
+                    json.dump(obj, f, ensure_ascii=False, indent=2)
+                else:
+                    json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+        if atomic:
+            os.replace(target, path)
+    except BaseException:
+        if atomic:
+            target.unlink(missing_ok=True)
+        raise
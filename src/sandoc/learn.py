@@ -11,13 +11,21 @@ sandoc.learn — 지식 축적 (Knowledge Accumulation)
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import dump_json, dumps_line, load_json
+from sandoc.parallel import fork_context, read_texts
+
 logger = logging.getLogger(__name__)
 
 # ── 섹션 키 → 평가 카테고리 매핑 ────────────────────────────────────
@@ -34,6 +42,12 @@ SECTION_CATEGORY_MAP = {
     "funding_plan": "재무계획",
 }
 
+# 초안 총 분량(문자 수)이 이 값 이상이면 섹션별 추출을 프로세스 풀로 병렬 처리
+_PARALLEL_MIN_CHARS = 1_000_000
+
+# 초안 파일명의 순번 접두사 (01_company_overview → company_overview)
+_SECTION_PREFIX_RE = re.compile(r"^\d+_")
+
 # 효과적 표현 추출 패턴
 EXPRESSION_PATTERNS = [
     # 수치가 포함된 구체적 성과 표현
@@ -54,6 +68,49 @@ STRUCTURE_PATTERNS = [
     ("section_header", r"□\s+.+|[0-9]+-[0-9]+[-.]?\s+", "섹션 헤더 구조"),
 ]
 
+# 패턴별 필수 리터럴: 이 중 하나도 본문에 없으면 해당 패턴은 매칭될 수 없으므로
+# 정규식 스캔 자체를 건너뜁니다 (RE2 prefilter 와 같은 방식의 사전 필터).
+_EXPRESSION_ANCHORS: dict[str, tuple[str, ...]] = {
+    "성과_수치": ("이상", "달성", "증가", "감소", "절감", "확보", "유치", "돌파"),
+    "비교우위": ("대비",),
+    "연도별목표": ("달성", "목표", "시작", "론칭", "확대"),
+    "차별점열거": ("①", "②", "③", "④", "⑤"),
+}
+_STRUCTURE_ANCHORS: dict[str, tuple[str, ...]] = {
+    "table": ("|",),
+    "bullet_hierarchy": ("◦",),
+    "numbered_list": (".",),
+    "section_header": ("□", "-"),
+}
+
+
+# 컴파일된 패턴 — 첫 추출 시점에 1회 컴파일하고 이후 캐시를 재사용합니다
+# (learn 을 쓰지 않는 경로는 임포트 시 컴파일 비용을 내지 않음).
+# 유형 라벨은 매칭마다 반복 저장되므로 sys.intern 으로 하나의 객체를 공유합니다.
+@functools.cache
+def _compiled_expression_patterns() -> tuple[
+    tuple[re.Pattern[str], str, tuple[str, ...]], ...
+]:
+    return tuple(
+        (re.compile(pattern), sys.intern(expr_type), _EXPRESSION_ANCHORS[expr_type])
+        for pattern, expr_type in EXPRESSION_PATTERNS
+    )
+
+
+@functools.cache
+def _compiled_structure_patterns() -> tuple[
+    tuple[str, re.Pattern[str], str, tuple[str, ...]], ...
+]:
+    return tuple(
+        (
+            sys.intern(pat_type),
+            re.compile(regex),
+            sys.intern(description),
+            _STRUCTURE_ANCHORS[pat_type],
+        )
+        for pat_type, regex, description in STRUCTURE_PATTERNS
+    )
+
 
 def run_learn(
     project_dir: Path,
@@ -94,7 +151,13 @@ def run_learn(
         )
         return result
 
-    md_files = sorted(drafts_dir.glob("*.md"))
+    # scandir 의 DirEntry 캐시로 파일 여부를 확인하고, 매칭된 항목만 Path 로 만듭니다
+    with os.scandir(drafts_dir) as it:
+        md_files = sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.name.endswith(".md") and entry.is_file()
+        )
     if not md_files:
         result["errors"].append("초안 마크다운 파일이 없습니다.")
         return result
@@ -117,7 +180,7 @@ def run_learn(
     announcement_type = "unknown"
     if context_path.exists():
         try:
-            ctx = json.loads(context_path.read_text(encoding="utf-8"))
+            ctx = load_json(context_path)
             project_name = ctx.get("project_name", project_name)
             aa = ctx.get("announcement_analysis", {})
             if aa:
@@ -125,32 +188,36 @@ def run_learn(
         except (json.JSONDecodeError, OSError):
             pass
 
-    # 각 섹션 처리
-    all_expressions: list[dict[str, str]] = []
+    # 각 섹션 처리 — 표현은 저장 직전까지 열(column) 단위 리스트로 모읍니다
+    expr_texts: list[str] = []
+    expr_types: list[str] = []
+    expr_sections: list[str] = []
+    expr_categories: list[str] = []
     all_patterns: list[dict[str, str]] = []
     sections_processed: list[str] = []
     lessons: list[str] = []
 
-    for md_path in md_files:
-        content = md_path.read_text(encoding="utf-8")
+    sections: list[tuple[str, str, str]] = []
+    for md_path, content in zip(md_files, read_texts(md_files)):
         if not content.strip():
             continue
 
         section_stem = md_path.stem
         # 섹션 키 추출 (01_company_overview → company_overview)
-        section_key = re.sub(r"^\d+_", "", section_stem)
+        section_key = sys.intern(_SECTION_PREFIX_RE.sub("", section_stem))
         category = SECTION_CATEGORY_MAP.get(section_key, "기타")
-
-        # 1. 표현 추출
-        expressions = _extract_expressions(content, section_key, category)
-        all_expressions.extend(expressions)
-
-        # 2. 구조 패턴 추출
-        patterns = _extract_patterns(content, section_key, category)
+        sections.append((content, section_key, category))
+
+    # 1. 표현 / 2. 구조 패턴 / 3. 교훈 추출
+    for (_content, section_key, category), ((texts, types), patterns, lesson) in zip(
+        sections, _extract_sections(sections)
+    ):
+        expr_texts.extend(texts)
+        # 프로세스 풀 결과는 역직렬화된 사본이므로 다시 intern 합니다
+        expr_types.extend(map(sys.intern, types))
+        expr_sections.extend([section_key] * len(texts))
+        expr_categories.extend([category] * len(texts))
         all_patterns.extend(patterns)
-
-        # 3. 교훈 추출
-        lesson = _extract_lesson(content, section_key, category)
         if lesson:
             lessons.append(lesson)
 
@@ -160,21 +227,19 @@ def run_learn(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # 1. 표현 저장
-    if all_expressions:
+    if expr_texts:
+        all_expressions = [
+            {"text": t, "type": tp, "section": sk, "category": c}
+            for t, tp, sk, c in zip(expr_texts, expr_types, expr_sections, expr_categories)
+        ]
         expr_path = expressions_dir / f"{project_name}_{timestamp}.json"
-        expr_path.write_text(
-            json.dumps(all_expressions, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        dump_json(expr_path, all_expressions)
         result["expressions_count"] = len(all_expressions)
 
     # 2. 패턴 저장
     if all_patterns:
         pat_path = patterns_dir / f"{project_name}_{timestamp}.json"
-        pat_path.write_text(
-            json.dumps(all_patterns, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        dump_json(pat_path, all_patterns)
         result["patterns_count"] = len(all_patterns)
 
     # 3. 교훈 기록
@@ -190,34 +255,90 @@ def run_learn(
     return result
 
 
+def _extract_section(
+    content: str, section_key: str, category: str
+) -> tuple[tuple[list[str], list[str]], list[dict[str, str]], str | None]:
+    """한 섹션에서 표현 (텍스트, 유형 열), 구조 패턴, 교훈을 모두 추출합니다."""
+    return (
+        _scan_expressions(content),
+        _extract_patterns(content, section_key, category),
+        _extract_lesson(content, section_key, category),
+    )
+
+
+def _extract_sections(
+    sections: list[tuple[str, str, str]],
+) -> list[tuple[tuple[list[str], list[str]], list[dict[str, str]], str | None]]:
+    """
+    (content, section_key, category) 목록을 추출합니다 (입력 순서 유지).
+
+    정규식 추출은 CPU 바운드라 GIL 을 놓지 않으므로, 초안 분량이
+    _PARALLEL_MIN_CHARS 이상이면 프로세스 풀로 섹션을 나눠 처리합니다
+    (fork 컨텍스트를 쓸 수 없는 플랫폼에서는 순차 처리).
+    """
+    total_chars = sum(len(content) for content, _, _ in sections)
+    mp_context = (
+        fork_context()
+        if len(sections) > 1 and total_chars >= _PARALLEL_MIN_CHARS
+        else None
+    )
+    if mp_context is not None:
+        workers = min(os.cpu_count() or 1, len(sections))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+                return list(ex.map(_extract_section, *zip(*sections)))
+        except (OSError, RuntimeError, BrokenProcessPool) as e:
+            logger.warning("병렬 추출 실패, 순차 처리로 전환: %s", e)
+    return [_extract_section(*section) for section in sections]
+
+
+def _scan_expressions(content: str) -> tuple[list[str], list[str]]:
+    """텍스트에서 효과적인 표현을 찾아 (텍스트 목록, 유형 목록) 으로 반환합니다."""
+    texts: list[str] = []
+    types: list[str] = []
+
+    for cre, expr_type, anchors in _compiled_expression_patterns():
+        if not any(a in content for a in anchors):
+            continue
+        for match in cre.finditer(content):
+            # group().strip() 대신 span 을 좁혀서 슬라이스 한 번만 할당
+            start, end = match.span()
+            while start < end and content[start].isspace():
+                start += 1
+            while end > start and content[end - 1].isspace():
+                end -= 1
+            if end - start > 10:  # 너무 짧은 건 스킵
+                texts.append(content[start:end])
+                types.append(expr_type)
+
+    return texts, types
+
+
 def _extract_expressions(
     content: str, section_key: str, category: str
 ) -> list[dict[str, str]]:
     """텍스트에서 효과적인 표현을 추출합니다."""
-    expressions: list[dict[str, str]] = []
-
-    for pattern, expr_type in EXPRESSION_PATTERNS:
-        for match in re.finditer(pattern, content):
-            text = match.group().strip()
-            if len(text) > 10:  # 너무 짧은 건 스킵
-                expressions.append({
-                    "text": text,
-                    "type": expr_type,
-                    "section": section_key,
-                    "category": category,
-                })
-
-    return expressions
+    section_key = sys.intern(section_key)
+    category = sys.intern(category)
+    texts, types = _scan_expressions(content)
+    return [
+        {"text": text, "type": expr_type, "section": section_key, "category": category}
+        for text, expr_type in zip(texts, types)
+    ]
 
 
 def _extract_patterns(
     content: str, section_key: str, category: str
 ) -> list[dict[str, str]]:
     """텍스트에서 구조적 패턴을 추출합니다."""
+    section_key = sys.intern(section_key)
+    category = sys.intern(category)
     patterns: list[dict[str, str]] = []
 
-    for pat_type, regex, description in STRUCTURE_PATTERNS:
-        matches = re.findall(regex, content)
+    for pat_type, cre, description, anchors in _compiled_structure_patterns():
+        if not any(a in content for a in anchors):
+            continue
+        matches = cre.findall(content)
         if matches:
             patterns.append({
                 "type": pat_type,
@@ -234,14 +355,23 @@ def _extract_patterns(
 def _extract_lesson(content: str, section_key: str, category: str) -> str | None:
     """섹션 내용에서 교훈/특징을 추출합니다."""
     char_count = len(content)
-    table_count = content.count("|---|")
-    bullet_count = content.count("◦")
-    numbered_count = len(re.findall(r"^\d+\.", content, re.MULTILINE))
 
-    # 의미 있는 내용이 있는 경우만
+    # 의미 있는 내용이 있는 경우만 (짧은 섹션은 집계 전에 바로 반환)
     if char_count < 100:
         return None
 
+    # 표/불릿/번호 목록을 한 번의 줄 단위 순회로 집계
+    table_count = bullet_count = numbered_count = 0
+    for line in content.split("\n"):
+        if "|" in line:
+            table_count += line.count("|---|")
+        if "◦" in line:
+            bullet_count += line.count("◦")
+        # "^\d+\." 과 동일: 줄 맨 앞이 숫자들이고 바로 뒤에 "." 이 오는 경우
+        dot = line.find(".")
+        if dot > 0 and line[:dot].isdecimal():
+            numbered_count += 1
+
     parts = []
     parts.append(f"- **{section_key}** ({category}): {char_count}자")
     if table_count:
@@ -275,13 +405,14 @@ def _append_lessons(
         content += "- 특별한 교훈 없음\n"
     content += "\n"
 
-    # 기존 파일에 추가
-    if lessons_path.exists():
-        existing = lessons_path.read_text(encoding="utf-8")
-    else:
-        existing = "# 📚 sandoc 학습 기록 (Lessons Learned)\n\n"
+    # 파일이 없으면 제목을 한 번만 쓰고, 이후에는 끝에 이어 씁니다
+    if not lessons_path.exists():
+        lessons_path.write_text(
+            "# 📚 sandoc 학습 기록 (Lessons Learned)\n\n", encoding="utf-8"
+        )
 
-    lessons_path.write_text(existing + content, encoding="utf-8")
+    with lessons_path.open("a", encoding="utf-8") as f:
+        f.write(content)
 
 
 def _record_processed(
@@ -290,22 +421,32 @@ def _record_processed(
     announcement_type: str,
     timestamp: str,
 ) -> None:
-    """처리 이력을 기록합니다."""
-    history_path = knowledge_dir / "processing_history.json"
-    history: list[dict[str, str]] = []
+    """처리 이력을 processing_history.jsonl 에 한 줄 추가합니다."""
+    history_path = knowledge_dir / "processing_history.jsonl"
+    _migrate_history(knowledge_dir, history_path)
 
-    if history_path.exists():
-        try:
-            history = json.loads(history_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            history = []
-
-    history.append({
+    line = dumps_line({
         "project": project_name,
         "announcement_type": announcement_type,
         "processed_at": timestamp,
     })
-
-    history_path.write_text(
-        json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    with history_path.open("ab") as f:
+        f.write(line)
+
+
+def _migrate_history(knowledge_dir: Path, history_path: Path) -> None:
+    """이전 형식(processing_history.json, JSON 배열)을 JSON Lines 로 변환합니다."""
+    legacy_path = knowledge_dir / "processing_history.json"
+    if history_path.exists() or not legacy_path.exists():
+        return
+
+    try:
+        history = load_json(legacy_path)
+    except (json.JSONDecodeError, OSError):
+        history = []
+    if not isinstance(history, list):
+        history = []
+
+    history_path.write_bytes(b"".join(dumps_line(entry) for entry in history))
+    legacy_path.unlink()
+    logger.info("처리 이력 변환: %s → %s", legacy_path, history_path)
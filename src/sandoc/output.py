@@ -12,7 +12,6 @@ sandoc.output — 출력 파이프라인
 
 from __future__ import annotations
 
-import json
 import logging
 import shutil
 from dataclasses import dataclass, field
@@ -21,10 +20,22 @@ from typing import Any
 
 from sandoc.generator import GeneratedPlan, GeneratedSection, PlanGenerator
 from sandoc.hwpx_engine import HwpxBuilder, StyleMirror, validate_hwpx
+from sandoc.jsonio import dump_json, load_json
 from sandoc.schema import CompanyInfo
 
 logger = logging.getLogger(__name__)
 
+# plan.json 섹션 항목의 필드별 기본값 (GeneratedPlan.to_dict 의 섹션 키와 동일)
+_SECTION_DEFAULTS: dict[str, Any] = {
+    "title": "",
+    "content": "",
+    "section_key": "",
+    "section_index": 0,
+    "word_count": 0,
+    "prompt": "",
+    "evaluation_category": "",
+}
+
 
 # ── 결과 데이터 클래스 ──────────────────────────────────────────────
 
@@ -98,28 +109,22 @@ class OutputPipeline:
         self.template_analysis = template_analysis or {}
         self.announcement_analysis = announcement_analysis or {}
 
-        # 스타일 미러 초기화
+        # 스타일 미러 + 스타일 프로파일 데이터 (생성기에 전달용)
+        # 프로파일 파일은 한 번만 읽어 StyleMirror 와 생성기가 같은 dict 를 공유합니다.
         if style_profile_path:
             self.style = StyleMirror.from_file(style_profile_path)
+            self._style_data = self.style.profile
         elif style_profile_data:
             self.style = StyleMirror(style_profile_data)
+            self._style_data = style_profile_data
         else:
             self.style = StyleMirror.default()
+            self._style_data = {}
 
         # 생성된 계획 로드
         self._plan = plan
         self._plan_json_path = plan_json_path
 
-        # 스타일 프로파일 데이터 (생성기에 전달용)
-        if style_profile_path:
-            self._style_data = json.loads(
-                Path(style_profile_path).read_text(encoding="utf-8")
-            )
-        elif style_profile_data:
-            self._style_data = style_profile_data
-        else:
-            self._style_data = {}
-
     def run(self, prompts_only: bool = False) -> BuildResult:
         """
         전체 출력 파이프라인을 실행합니다.
@@ -152,7 +157,7 @@ class OutputPipeline:
 
             # 4. plan.json 저장
             plan_path = self.output_dir / "plan.json"
-            plan_path.write_text(plan.to_json(), encoding="utf-8")
+            dump_json(plan_path, plan.to_dict())
             result.plan_json_path = str(plan_path)
 
             # 5. 섹션 파일 저장
@@ -224,7 +229,7 @@ class OutputPipeline:
     def _load_plan_from_json(path: str | Path) -> GeneratedPlan:
         """plan.json 파일에서 GeneratedPlan 복원."""
         path = Path(path)
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json(path)
 
         plan = GeneratedPlan(
             title=data.get("title", ""),
@@ -233,37 +238,34 @@ class OutputPipeline:
             metadata=data.get("metadata", {}),
         )
 
-        for sec_data in data.get("sections", []):
-            section = GeneratedSection(
-                title=sec_data.get("title", ""),
-                content=sec_data.get("content", ""),
-                section_key=sec_data.get("section_key", ""),
-                section_index=sec_data.get("section_index", 0),
-                word_count=sec_data.get("word_count", 0),
-                prompt=sec_data.get("prompt", ""),
-                evaluation_category=sec_data.get("evaluation_category", ""),
-            )
-            plan.sections.append(section)
+        # 알려진 필드만 골라 기본값 위에 덮어씁니다 (미지의 키는 무시)
+        plan.sections = [
+            GeneratedSection(**{
+                **_SECTION_DEFAULTS,
+                **{k: v for k, v in sec_data.items() if k in _SECTION_DEFAULTS},
+            })
+            for sec_data in data.get("sections", ())
+        ]
 
         return plan
 
     def _build_hwpx(self, plan: GeneratedPlan, output_path: Path) -> Path:
         """GeneratedPlan → HWPX 파일 빌드."""
         builder = HwpxBuilder(style=self.style)
-
-        for section in plan.sections:
-            builder.add_section(
-                title=section.title,
-                content=section.content,
-                style_name="bodyText",
-                section_key=section.section_key,
-            )
-
+        _add_plan_sections(builder, plan)
         return builder.build(output_path)
 
 
 # ── 편의 함수 ──────────────────────────────────────────────────
 
+def _add_plan_sections(builder: HwpxBuilder, plan: GeneratedPlan) -> None:
+    """GeneratedPlan 의 섹션을 본문 스타일(bodyText)로 빌더에 추가합니다."""
+    add = builder.add_section
+    for section in plan.sections:
+        # add_section(title, content, style_name, section_key) — 위치 인자로 호출
+        add(section.title, section.content, "bodyText", section.section_key)
+
+
 def build_hwpx_from_plan(
     plan: GeneratedPlan,
     output_path: str | Path,
@@ -286,15 +288,7 @@ def build_hwpx_from_plan(
         style = StyleMirror.default()
 
     builder = HwpxBuilder(style=style)
-
-    for section in plan.sections:
-        builder.add_section(
-            title=section.title,
-            content=section.content,
-            style_name="bodyText",
-            section_key=section.section_key,
-        )
-
+    _add_plan_sections(builder, plan)
     return builder.build(output_path)
 
 
@@ -0,0 +1,41 @@
+"""
+sandoc.parallel — 라이브러리 내부 병렬 처리 헬퍼
+
+작업 프로세스 풀의 시작 방식 선택과 여러 파일 병렬 읽기를 한 곳에 모아 둡니다.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# 텍스트 파일 병렬 읽기 시 최대 스레드 수
+_READ_WORKERS = 8
+
+
+def fork_context() -> Any:
+    """Linux 이면 fork 컨텍스트, 아니면 None.
+
+    spawn 방식은 호출 측 __main__ 을 다시 import 하므로 (if __name__ == "__main__"
+    보호가 없는 스크립트에서 문제), 라이브러리 내부 병렬화는 fork 에서만 사용합니다.
+    macOS 는 fork 를 지원하지만 스레드나 시스템 프레임워크가 이미 동작 중이면
+    exec 없는 fork 가 안전하지 않으므로 (파이프라인은 스레드 풀을 씀) 제외합니다.
+    None 이면 호출 측은 순차 처리합니다.
+    """
+    if sys.platform != "linux" or "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def read_texts(paths: list[Path]) -> list[str]:
+    """UTF-8 텍스트 파일들을 읽어 내용 목록으로 반환합니다 (입력 순서 유지).
+
+    파일 읽기는 I/O 대기가 대부분이므로 여러 개면 스레드 풀로 겹쳐서 읽습니다.
+    """
+    if len(paths) <= 1:
+        return [p.read_text(encoding="utf-8") for p in paths]
+    with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(paths))) as ex:
+        return list(ex.map(lambda p: p.read_text(encoding="utf-8"), paths))
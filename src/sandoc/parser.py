@@ -9,15 +9,26 @@ HWP 5.x OLE2 파일을 olefile + zlib + struct 로 직접 파싱하여
 
 from __future__ import annotations
 
+import functools
 import logging
+import mmap
+import re
 import struct
-import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import olefile
 
+from sandoc.parallel import fork_context
+
+try:  # ISA-L 기반 deflate 디코더가 있으면 사용 (pip install isal)
+    from isal import isal_zlib as _zlib  # type: ignore[import-not-found]
+except ImportError:
+    import zlib as _zlib
+
 logger = logging.getLogger(__name__)
 
 # ── HWP 5.x 레코드 태그 ID ──────────────────────────────────────
@@ -33,6 +44,19 @@ HWPTAG_COLUMN_DEF = 74                        # 단 정의
 HWPTAG_TABLE = 75                             # 표 정의
 HWPTAG_CELL_DEF = 77                          # 셀 정의
 
+# 사람이 읽을 수 있는 BodyText 태그 이름 (HwpRecord.tag_name)
+_TAG_NAMES = {
+    HWPTAG_PARA_HEADER: "PARA_HEADER",
+    HWPTAG_PARA_TEXT: "PARA_TEXT",
+    HWPTAG_PARA_CHAR_SHAPE: "PARA_CHAR_SHAPE",
+    HWPTAG_PARA_LINE_SEG: "PARA_LINE_SEG",
+    HWPTAG_CTRL_HEADER: "CTRL_HEADER",
+    HWPTAG_LIST_HEADER: "LIST_HEADER",
+    HWPTAG_SEC_DEF: "SEC_DEF",
+    HWPTAG_TABLE: "TABLE",
+    HWPTAG_CELL_DEF: "CELL_DEF",
+}
+
 # DocInfo record tags
 HWPTAG_DOCUMENT_PROPERTIES = 16              # 문서 속성
 HWPTAG_ID_MAPPINGS = 17                      # ID 매핑
@@ -45,21 +69,51 @@ HWPTAG_BULLET = 24                           # 불릿
 HWPTAG_PARA_SHAPE = 25                       # 문단 모양
 HWPTAG_STYLE = 26                            # 스타일
 
+# 파서가 실제로 사용하는 레코드 태그 — 그 외 레코드는 HwpRecord 를 만들지 않음
+_DOCINFO_TAGS = frozenset({HWPTAG_FACE_NAME, HWPTAG_CHAR_SHAPE, HWPTAG_STYLE})
+_BODY_TAGS = frozenset({HWPTAG_PARA_TEXT, HWPTAG_TABLE, HWPTAG_SEC_DEF})
+
 # HWP 인라인 컨트롤 코드 (UTF-16LE 2바이트 문자)
 # 0x0001~0x0008: 특수 컨트롤 문자, 각각 뒤에 14바이트(7 UTF-16LE chars) 추가 데이터
 HWP_INLINE_CTRL_CHARS = set(range(0x0001, 0x0009))
 # 0x000A: 줄바꿈, 0x000D: 문단 끝 — 일반 텍스트로 처리
 HWP_CHAR_LINE_BREAK = 0x000A
 HWP_CHAR_PARA_END = 0x000D
+# 0x0000~0x001F 범위의 UTF-16LE 코드 유닛 (짝수 오프셋 여부는 호출 측에서 확인)
+_CTRL_UNIT_RE = re.compile(rb"[\x00-\x1f]\x00")
+# 제어 코드 → (출력 문자열, 소비 바이트 수) 조회 테이블
+#   인라인 컨트롤: 코드 + 추가 14바이트(7 UTF-16LE chars) 건너뛰기
+#   줄바꿈/탭: 그대로 출력, 문단 끝(0x000D)과 기타 제어문자: 버림
+_CTRL_ACTIONS: tuple[tuple[str, int], ...] = tuple(
+    ("", 16) if code in HWP_INLINE_CTRL_CHARS
+    else ("\n", 2) if code == HWP_CHAR_LINE_BREAK
+    else ("\t", 2) if code == 0x0009
+    else ("", 2)
+    for code in range(0x20)
+)
 
 # ── HWP 단위 변환 ───────────────────────────────────────────────
 HWPUNIT_TO_MM = 1 / 7200 * 25.4   # 1 HWP unit = 1/7200 inch
 HWPUNIT_TO_PT = 1 / 100           # 폰트 크기용 (HWP는 pt × 100)
 
+# 압축 스트림을 읽어 들이는 단위
+_STREAM_CHUNK = 64 * 1024
+
+# 레코드 헤더 / 확장 크기 (little-endian uint32), 길이 접두사 (uint16)
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+
+# DocInfo / BodyText 레코드 고정 헤더 — 레코드마다 포맷 문자열을 다시 해석하지 않도록 미리 컴파일
+_CHAR_SHAPE_FONT_IDS = struct.Struct("<7H")              # 스크립트별 폰트 ID
+_CHAR_SHAPE_HEADER = struct.Struct("<7H28xII")           # 폰트 ID + (장평/자간/상대크기/위치) + 크기 + 속성
+_FACE_NAME_HEADER = struct.Struct("<BH")                 # 속성 + 이름 길이
+_TABLE_HEADER = struct.Struct("<4xHH")                   # (속성) + 행 수 + 열 수
+_PAGE_DEF = struct.Struct("<9I")                         # 용지 크기 + 여백
+
 
 # ── 데이터 클래스 ────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class HwpRecord:
     """HWP 5.x TLV 레코드."""
     tag_id: int
@@ -71,21 +125,11 @@ class HwpRecord:
     @property
     def tag_name(self) -> str:
         """사람이 읽을 수 있는 태그 이름."""
-        _names = {
-            HWPTAG_PARA_HEADER: "PARA_HEADER",
-            HWPTAG_PARA_TEXT: "PARA_TEXT",
-            HWPTAG_PARA_CHAR_SHAPE: "PARA_CHAR_SHAPE",
-            HWPTAG_PARA_LINE_SEG: "PARA_LINE_SEG",
-            HWPTAG_CTRL_HEADER: "CTRL_HEADER",
-            HWPTAG_LIST_HEADER: "LIST_HEADER",
-            HWPTAG_SEC_DEF: "SEC_DEF",
-            HWPTAG_TABLE: "TABLE",
-            HWPTAG_CELL_DEF: "CELL_DEF",
-        }
-        return _names.get(self.tag_id, f"TAG_{self.tag_id}")
+        name = _TAG_NAMES.get(self.tag_id)
+        return name if name is not None else f"TAG_{self.tag_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpParagraph:
     """추출된 문단."""
     text: str
@@ -94,7 +138,7 @@ class HwpParagraph:
     level: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpTable:
     """추출된 표 구조."""
     rows: int
@@ -103,7 +147,7 @@ class HwpTable:
     table_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpPageLayout:
     """페이지 레이아웃 정보."""
     paper_width_mm: float = 210.0
@@ -117,14 +161,14 @@ class HwpPageLayout:
     margin_gutter_mm: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpFontInfo:
     """폰트 정보."""
     name: str
     script_type: str = ""   # 한글/영문/한자/일본어/기타/기호/사용자
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpCharShape:
     """문자 모양 정보."""
     font_ids: list[int] = field(default_factory=list)  # 7개 스크립트별 폰트 인덱스
@@ -151,15 +195,17 @@ class HwpParseResult:
     styles: list[dict[str, Any]] = field(default_factory=list)
     sections: list[str] = field(default_factory=list)
 
-    @property
+    # 파싱이 끝난 뒤에는 paragraphs 가 바뀌지 않으므로 첫 접근 시 계산해 캐시합니다.
+    @functools.cached_property
     def full_text(self) -> str:
         """전체 텍스트를 하나의 문자열로."""
-        return "\n".join(p.text for p in self.paragraphs if p.text.strip())
+        return "\n".join(self.text_paragraphs)
 
-    @property
+    @functools.cached_property
     def text_paragraphs(self) -> list[str]:
         """비어있지 않은 문단 텍스트 목록."""
-        return [p.text for p in self.paragraphs if p.text.strip()]
+        # isspace() 는 strip() 과 달리 새 문자열을 만들지 않음 ("" 는 별도로 제외)
+        return [t for p in self.paragraphs if (t := p.text) and not t.isspace()]
 
 
 @dataclass
@@ -170,7 +216,7 @@ class PdfParseResult:
     tables: list[list[list[str]]] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    @property
+    @functools.cached_property
     def full_text(self) -> str:
         return "\n\n".join(self.pages)
 
@@ -215,19 +261,52 @@ def _read_hwp_header(ole: olefile.OleFileIO) -> dict[str, Any]:
     }
 
 
-def _decompress_stream(ole: olefile.OleFileIO, stream_name: str, compressed: bool = True) -> bytes:
-    """OLE2 스트림 읽기 + zlib 압축 해제 (raw deflate, wbits=-15)."""
-    raw = ole.openstream(stream_name).read()
+def _decompress_stream(
+    ole: olefile.OleFileIO, stream_name: str, compressed: bool = True,
+) -> bytes | bytearray:
+    """OLE2 스트림 읽기 + 압축 해제 (raw deflate, wbits=-15)."""
+    return _inflate_stream(ole.openstream(stream_name), stream_name, compressed)
+
+
+def _inflate_stream(
+    stream: BinaryIO, stream_name: str, compressed: bool = True,
+) -> bytes | bytearray:
+    """
+    이미 열린 OLE2 스트림의 압축 해제 (raw deflate, wbits=-15).
+
+    isal 이 설치되어 있으면 ISA-L 디코더를, 없으면 표준 zlib 을 사용합니다.
+
+    _STREAM_CHUNK 단위로 decompressobj 에 흘려보내고, 결과는 하나의 bytearray 에
+    이어 붙여 반환합니다 (블록 목록을 b"".join 으로 합치며 출력을 두 벌 들고
+    있지 않음). OleFileIO 에 접근하지 않으므로 스트림만 미리 열어 두면
+    스레드에서 호출해도 안전합니다.
+    """
     if not compressed:
-        return raw
+        return stream.read()
+
+    d = _zlib.decompressobj(-15)
+    out = bytearray()
     try:
-        return zlib.decompress(raw, -15)
-    except zlib.error:
+        while chunk := stream.read(_STREAM_CHUNK):
+            out += d.decompress(chunk)
+        out += d.flush()
+        if not d.eof:
+            raise _zlib.error("incomplete or truncated stream")
+    except _zlib.error:
         logger.warning("zlib 압축 해제 실패: %s — 원본 데이터 반환", stream_name)
-        return raw
+        stream.seek(0)
+        return stream.read()
+    return out
+
+
+def _parse_body_section(stream: BinaryIO, stream_name: str, compressed: bool) -> list[HwpRecord]:
+    """BodyText 섹션 스트림 하나를 압축 해제하고 본문 레코드를 파싱합니다."""
+    return _parse_records(_inflate_stream(stream, stream_name, compressed), _BODY_TAGS)
 
 
-def _parse_records(data: bytes) -> list[HwpRecord]:
+def _parse_records(
+    data: bytes | bytearray, tags: frozenset[int] | None = None,
+) -> list[HwpRecord]:
     """
     바이너리 데이터에서 HWP 5.x TLV 레코드 파싱.
 
@@ -236,32 +315,42 @@ def _parse_records(data: bytes) -> list[HwpRecord]:
       - Level:  bits 10-19 (10 bits)
       - Size:   bits 20-31 (12 bits)
       - Size == 0xFFF → 다음 4바이트가 실제 크기 (uint32)
+
+    tags 가 주어지면 해당 태그의 레코드만 HwpRecord 로 만들고,
+    나머지는 헤더만 읽고 건너뜁니다 (데이터 슬라이스 복사 없음).
+    레코드 데이터는 memoryview 로 잘라 bytes 로 한 번만 복사합니다
+    (압축 해제 결과인 bytearray 를 그대로 받아도 레코드는 bytes).
     """
     records: list[HwpRecord] = []
+    append = records.append
+    unpack_u32 = _U32.unpack_from
+    view = memoryview(data)
+    n = len(data)
     pos = 0
-    while pos + 4 <= len(data):
-        header = struct.unpack_from("<I", data, pos)[0]
+    while pos + 4 <= n:
+        header = unpack_u32(data, pos)[0]
         tag_id = header & 0x3FF
         level = (header >> 10) & 0x3FF
-        size = (header >> 20) & 0xFFF
+        size = header >> 20
 
         pos += 4
 
         # 확장 크기
         if size == 0xFFF:
-            if pos + 4 > len(data):
+            if pos + 4 > n:
                 break
-            size = struct.unpack_from("<I", data, pos)[0]
+            size = unpack_u32(data, pos)[0]
             pos += 4
 
-        if pos + size > len(data):
+        if pos + size > n:
             # 잘린 레코드 — 남은 데이터만 저장
-            rec_data = data[pos:]
-            records.append(HwpRecord(tag_id=tag_id, level=level, size=len(rec_data), data=rec_data, offset=pos))
+            if tags is None or tag_id in tags:
+                rec_data = view[pos:].tobytes()
+                append(HwpRecord(tag_id, level, len(rec_data), rec_data, pos))
             break
 
-        rec_data = data[pos: pos + size]
-        records.append(HwpRecord(tag_id=tag_id, level=level, size=size, data=rec_data, offset=pos))
+        if tags is None or tag_id in tags:
+            append(HwpRecord(tag_id, level, size, view[pos: pos + size].tobytes(), pos))
         pos += size
 
     return records
@@ -273,30 +362,32 @@ def _decode_para_text(data: bytes) -> str:
 
     HWP 인라인 컨트롤 코드(0x0001~0x0008)를 건너뛰고,
     줄바꿈(0x000A)과 문단 끝(0x000D)은 적절히 처리합니다.
+
+    문자 단위 루프 대신 제어문자(< 0x0020) 위치만 bytes 수준에서 찾고,
+    그 사이 구간은 ``bytes.decode`` 로 한 번에 변환합니다.
     """
+    end = len(data) & ~1
     chars: list[str] = []
-    i = 0
-    while i + 1 < len(data):
-        code = struct.unpack_from("<H", data, i)[0]
-        i += 2
-
-        if code in HWP_INLINE_CTRL_CHARS:
-            # 인라인 컨트롤: 추가 14바이트(7 UTF-16LE chars) 건너뛰기
-            i += 14
-            continue
-        elif code == HWP_CHAR_LINE_BREAK:
-            chars.append("\n")
-        elif code == HWP_CHAR_PARA_END:
-            # 문단 끝 — 무시 (문단 단위로 이미 분리됨)
-            continue
-        elif code < 0x0020 and code not in (0x0009, 0x000A, 0x000D):
-            # 기타 제어문자 건너뛰기 (탭은 유지)
-            if code == 0x0009:
-                chars.append("\t")
+    start = 0
+    pos = 0
+    while True:
+        m = _CTRL_UNIT_RE.search(data, pos, end)
+        if m is None:
+            break
+        i = m.start()
+        if i & 1:
+            # 홀수 위치 매치는 코드 유닛 경계가 아님 — 한 바이트 뒤부터 다시 검색
+            pos = i + 1
             continue
-        else:
-            chars.append(chr(code))
-
+        if i > start:
+            chars.append(data[start:i].decode("utf-16-le", errors="surrogatepass"))
+        replacement, width = _CTRL_ACTIONS[data[i]]
+        if replacement:
+            chars.append(replacement)
+        start = pos = i + width
+
+    if start < end:
+        chars.append(data[start:end].decode("utf-16-le", errors="surrogatepass"))
     return "".join(chars)
 
 
@@ -304,7 +395,7 @@ def _parse_page_def(data: bytes) -> HwpPageLayout:
     """PAGE_DEF 레코드에서 페이지 레이아웃 추출."""
     layout = HwpPageLayout()
     if len(data) >= 40:
-        vals = struct.unpack_from("<IIIIIIIII", data, 0)
+        vals = _PAGE_DEF.unpack_from(data)
         # 순서: 용지폭, 용지높이, 여백(좌, 우, 상, 하), 머리말, 꼬리말, 제본
         layout.paper_width_mm = round(vals[0] * HWPUNIT_TO_MM, 1)
         layout.paper_height_mm = round(vals[1] * HWPUNIT_TO_MM, 1)
@@ -322,10 +413,7 @@ def _parse_table_record(data: bytes) -> tuple[int, int]:
     """TABLE 레코드에서 행×열 크기 추출."""
     if len(data) >= 8:
         # TABLE 레코드 시작: 속성(4바이트) + 행 수(2바이트) + 열 수(2바이트)
-        flags = struct.unpack_from("<I", data, 0)[0]
-        rows = struct.unpack_from("<H", data, 4)[0]
-        cols = struct.unpack_from("<H", data, 6)[0]
-        return rows, cols
+        return _TABLE_HEADER.unpack_from(data)
     return 0, 0
 
 
@@ -339,42 +427,50 @@ def _parse_face_name(data: bytes) -> str:
     # 실제로는 다양한 포맷이 있으므로 null-terminated 검색
     try:
         # 속성 바이트 건너뛰고, 이름 길이 읽기
-        _prop = data[0]
-        name_len = struct.unpack_from("<H", data, 1)[0]
+        _prop, name_len = _FACE_NAME_HEADER.unpack_from(data)
         name_data = data[3: 3 + name_len * 2]
         return name_data.decode("utf-16-le", errors="replace").rstrip("\x00")
     except Exception:
         return ""
 
 
+def _parse_style_name(data: bytes) -> str:
+    """STYLE 레코드에서 (한글) 스타일 이름 추출."""
+    # 이름 길이(2바이트 = UTF-16LE 문자 수) + 이름 + 영문 이름 길이 + 영문 이름 + 속성 ...
+    if len(data) < 2:
+        return ""
+    name_len = _U16.unpack_from(data)[0]
+    return data[2: 2 + name_len * 2].decode("utf-16-le", errors="replace")
+
+
 def _parse_char_shape(data: bytes) -> HwpCharShape:
     """CHAR_SHAPE 레코드에서 문자 모양 추출."""
     cs = HwpCharShape()
     if len(data) < 42:
         return cs
 
-    # 7개 스크립트별 폰트 ID (각 2바이트 = 14바이트, offset 0~13)
-    cs.font_ids = [struct.unpack_from("<H", data, i * 2)[0] for i in range(7)]
-
+    # offset 0~13:  7개 스크립트별 폰트 ID (각 2바이트)
     # offset 14~20: 장평 비율 (각 1바이트, 100 = 100%)
     # offset 21~27: 자간 (각 1바이트)
     # offset 28~34: 상대 크기 (각 1바이트, 100 = 100%)
     # offset 35~41: 글자 위치 (각 1바이트)
     # offset 42~45: 폰트 크기 (uint32, pt × 100)
-    if len(data) >= 46:
-        font_size_raw = struct.unpack_from("<I", data, 42)[0]
-        cs.font_size_pt = round(font_size_raw * HWPUNIT_TO_PT, 1)
-
     # offset 46~49: 속성 (uint32)
-    if len(data) >= 50:
-        attr = struct.unpack_from("<I", data, 46)[0]
+    if len(data) >= _CHAR_SHAPE_HEADER.size:
+        *font_ids, font_size_raw, attr = _CHAR_SHAPE_HEADER.unpack_from(data)
+        cs.font_ids = font_ids
+        cs.font_size_pt = round(font_size_raw * HWPUNIT_TO_PT, 1)
         cs.italic = bool(attr & 0x01)
         cs.bold = bool(attr & 0x02)
         cs.underline = bool(attr & 0x04)
+    else:
+        cs.font_ids = list(_CHAR_SHAPE_FONT_IDS.unpack_from(data))
+        if len(data) >= 46:
+            cs.font_size_pt = round(_U32.unpack_from(data, 42)[0] * HWPUNIT_TO_PT, 1)
 
     # offset 60~63: 글자색 (COLORREF: 0x00BBGGRR)
     if len(data) >= 64:
-        color = struct.unpack_from("<I", data, 60)[0]
+        color = _U32.unpack_from(data, 60)[0]
         if color != 0xFFFFFFFF:  # 0xFFFFFFFF는 기본색
             r = color & 0xFF
             g = (color >> 8) & 0xFF
@@ -390,6 +486,9 @@ def parse_hwp(path: str | Path) -> HwpParseResult:
     """
     HWP 5.x 파일을 파싱하여 텍스트, 표, 스타일 정보를 추출합니다.
 
+    같은 파일(경로, 수정 시각, 크기가 동일)을 다시 파싱하면 캐시된 결과를
+    반환하므로, 반환값은 읽기 전용으로 다뤄야 합니다.
+
     Args:
         path: HWP 파일 경로
 
@@ -401,15 +500,32 @@ def parse_hwp(path: str | Path) -> HwpParseResult:
         ValueError: HWP 파일이 아니거나 암호화된 경우
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}") from None
+    return _parse_hwp_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
-    if not olefile.isOleFile(str(path)):
+@functools.lru_cache(maxsize=32)
+def _parse_hwp_cached(path_str: str, mtime_ns: int, size: int) -> HwpParseResult:
+    """(경로, mtime, 크기) 키로 캐시되는 parse_hwp 본체."""
+    path = Path(path_str)
+    if not olefile.isOleFile(path_str):
         raise ValueError(f"OLE2(HWP) 파일이 아닙니다: {path}")
 
-    result = HwpParseResult(file_path=str(path))
+    result = HwpParseResult(file_path=path_str)
+
+    # 파일 전체를 mmap 으로 매핑해 두면 olefile 의 섹터 단위 seek/read 가
+    # 시스템 콜 없이 페이지 캐시에서 바로 복사됩니다.
+    with (
+        open(path_str, "rb") as fp,
+        mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        olefile.OleFileIO(mm) as ole,
+    ):
+        if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
 
-    with olefile.OleFileIO(str(path)) as ole:
         # 1) 파일 헤더 파싱
         header = _read_hwp_header(ole)
         result.version = header["version"]
@@ -427,23 +543,25 @@ def parse_hwp(path: str | Path) -> HwpParseResult:
         # 2) DocInfo 파싱 — 폰트, 문자 모양, 스타일
         if ole.exists("DocInfo"):
             docinfo_data = _decompress_stream(ole, "DocInfo", result.compressed)
-            docinfo_records = _parse_records(docinfo_data)
+            docinfo_records = _parse_records(docinfo_data, _DOCINFO_TAGS)
             _extract_docinfo(docinfo_records, result)
 
         # 3) BodyText 섹션 파싱
-        section_idx = 0
-        while True:
-            stream_name = f"BodyText/Section{section_idx}"
-            if not ole.exists(stream_name):
-                break
-            result.sections.append(stream_name)
-
-            body_data = _decompress_stream(ole, stream_name, result.compressed)
-            body_records = _parse_records(body_data)
+        while ole.exists(f"BodyText/Section{len(result.sections)}"):
+            result.sections.append(f"BodyText/Section{len(result.sections)}")
+
+        # olefile 은 스레드 안전하지 않으므로 스트림 열기는 순차로 하고,
+        # 섹션별 압축 해제 + 레코드 파싱만 병렬로 처리 (결과는 섹션 순서대로 병합)
+        streams = [ole.openstream(name) for name in result.sections]
+        compressed = repeat(result.compressed)
+        if len(streams) > 1:
+            with ThreadPoolExecutor(max_workers=min(4, len(streams))) as ex:
+                section_records = list(ex.map(_parse_body_section, streams, result.sections, compressed))
+        else:
+            section_records = list(map(_parse_body_section, streams, result.sections, compressed))
+        for body_records in section_records:
             _extract_body_content(body_records, result)
 
-            section_idx += 1
-
         logger.info(
             "파싱 완료: %d 문단, %d 표, %d 폰트, %d 섹션",
             len(result.paragraphs), len(result.tables),
@@ -466,19 +584,7 @@ def _extract_docinfo(records: list[HwpRecord], result: HwpParseResult) -> None:
             result.char_shapes.append(cs)
 
         elif rec.tag_id == HWPTAG_STYLE:
-            # 스타일 레코드: 이름(UTF-16LE null-terminated) + 속성
-            try:
-                # 한글 이름: null-terminated UTF-16LE
-                end = rec.data.find(b"\x00\x00")
-                if end >= 0:
-                    # null-terminated 이지만 UTF-16LE 이므로 짝수 위치에서 끊기
-                    end_pos = end + (1 if end % 2 == 0 else 0)
-                    style_name = rec.data[:end_pos].decode("utf-16-le", errors="replace").rstrip("\x00")
-                else:
-                    style_name = rec.data.decode("utf-16-le", errors="replace").rstrip("\x00")
-                result.styles.append({"name": style_name})
-            except Exception:
-                result.styles.append({"name": ""})
+            result.styles.append({"name": _parse_style_name(rec.data)})
 
 
 def _extract_body_content(records: list[HwpRecord], result: HwpParseResult) -> None:
@@ -534,27 +640,71 @@ def _finalize_table(table: HwpTable, cell_texts: list[str]) -> None:
         table.cells = [cell_texts]
         return
 
-    cells: list[list[str]] = []
-    for r in range(table.rows):
-        row: list[str] = []
-        for c in range(table.cols):
-            idx = r * table.cols + c
-            if idx < len(cell_texts):
-                row.append(cell_texts[idx])
-            else:
-                row.append("")
-        cells.append(row)
-    table.cells = cells
+    rows, cols = table.rows, table.cols
+    total = rows * cols
+    # 부족한 셀은 빈 문자열로 한 번에 채운 뒤 행 단위로 슬라이스
+    padded = cell_texts
+    if len(padded) < total:
+        padded = padded + [""] * (total - len(padded))
+    table.cells = [padded[i: i + cols] for i in range(0, total, cols)]
 
 
 # ── PDF 파싱 ─────────────────────────────────────────────────────
 
-def parse_pdf(path: str | Path) -> PdfParseResult:
+def _read_pdf_page(
+    page: Any,
+    extract_tables: bool,
+    pages_out: list[str],
+    tables_out: list[list[list[str]]],
+) -> None:
+    """pdfplumber 페이지 하나의 텍스트 (및 표) 를 결과 목록에 추가."""
+    # 텍스트 추출
+    text = page.extract_text() or ""
+    pages_out.append(text)
+
+    if not extract_tables:
+        return
+
+    # 표 추출
+    tables = page.extract_tables() or []
+    for table in tables:
+        # pdfplumber table: list[list[str | None]]
+        cleaned = []
+        for row in table:
+            cleaned.append([cell or "" for cell in row])
+        tables_out.append(cleaned)
+
+
+def _parse_pdf_page_range(
+    path: str, start: int, stop: int, extract_tables: bool,
+) -> tuple[list[str], list[list[list[str]]]]:
+    """[start, stop) 페이지만 파싱 (병렬 파싱 작업 프로세스용)."""
+    import pdfplumber
+
+    pages: list[str] = []
+    tables: list[list[list[str]]] = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:stop]:
+            _read_pdf_page(page, extract_tables, pages, tables)
+    return pages, tables
+
+
+def parse_pdf(
+    path: str | Path,
+    *,
+    extract_tables: bool = True,
+    max_pages: int | None = None,
+    workers: int = 1,
+) -> PdfParseResult:
     """
     PDF 파일에서 텍스트와 표를 추출합니다.
 
     Args:
         path: PDF 파일 경로
+        extract_tables: False 이면 표 추출(선 검출, 페이지당 가장 비싼 단계)을 건너뜀
+        max_pages: 앞에서부터 읽을 최대 페이지 수 (None: 전체)
+        workers: 2 이상이면 페이지 구간을 작업 프로세스들에 나눠 병렬 파싱
+            (Linux 에서만, 결과와 순서는 순차 파싱과 동일)
 
     Returns:
         PdfParseResult: 파싱된 PDF 데이터
@@ -577,22 +727,34 @@ def parse_pdf(path: str | Path) -> PdfParseResult:
 
     result = PdfParseResult(file_path=str(path))
 
+    ranges: list[tuple[int, int]] = []
+    mp_context = fork_context() if workers > 1 else None
     with pdfplumber.open(str(path)) as pdf:
         result.metadata = pdf.metadata or {}
 
-        for page in pdf.pages:
-            # 텍스트 추출
-            text = page.extract_text() or ""
-            result.pages.append(text)
-
-            # 표 추출
-            tables = page.extract_tables() or []
-            for table in tables:
-                # pdfplumber table: list[list[str | None]]
-                cleaned = []
-                for row in table:
-                    cleaned.append([cell or "" for cell in row])
-                result.tables.append(cleaned)
+        pages = pdf.pages if max_pages is None else pdf.pages[:max_pages]
+        if mp_context is not None and len(pages) > 1:
+            # 페이지마다 처리 시간 편차가 커서 작업 수의 2배 구간으로 나눔
+            step = max(1, -(-len(pages) // (workers * 2)))
+            ranges = [(i, min(i + step, len(pages))) for i in range(0, len(pages), step)]
+        else:
+            for page in pages:
+                _read_pdf_page(page, extract_tables, result.pages, result.tables)
+
+    if ranges:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges)), mp_context=mp_context,
+        ) as ex:
+            chunks = ex.map(
+                _parse_pdf_page_range,
+                repeat(str(path)),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges],
+                repeat(extract_tables),
+            )
+            for page_texts, page_tables in chunks:
+                result.pages.extend(page_texts)
+                result.tables.extend(page_tables)
 
     logger.info("PDF 파싱 완료: %d 페이지, %d 표", result.page_count, len(result.tables))
     return result
@@ -10,12 +10,16 @@ profiles/{회사명}.json 형식으로 저장하며
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import dump_json
+from sandoc.parser import parse_pdf
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,18 +44,20 @@ FINANCIAL_FIELDS = [
     ("employee_count", r"(?:직원\s*수|종업원\s*수|상시\s*근로자)[^\S\n]*[:\s]?\s*(\d+)\s*명?"),
 ]
 
+# 모듈 로드 시 한 번만 컴파일 — 문서마다 re 캐시 조회를 반복하지 않도록
+_REGISTRATION_PATTERNS = [(name, re.compile(p)) for name, p in REGISTRATION_FIELDS]
+_FINANCIAL_PATTERNS = [(name, re.compile(p)) for name, p in FINANCIAL_FIELDS]
+
+# docs 폴더 파일명으로 문서 유형 분류 (대소문자 무시)
+_REG_DOC_RE = re.compile(r"사업자등록|등록증|registration", re.IGNORECASE)
+_FIN_DOC_RE = re.compile(r"재무|결산|financial|손익|대차", re.IGNORECASE)
+
 
 def _extract_text_from_pdf(pdf_path: Path) -> str:
-    """PDF에서 텍스트 추출."""
+    """PDF에서 텍스트 추출 (표 추출 없이 최대 10페이지)."""
     try:
-        import pdfplumber
-        text_parts: list[str] = []
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for page in pdf.pages[:10]:  # 최대 10페이지
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-        return "\n".join(text_parts)
+        st = pdf_path.stat()
+        return _pdf_text_cached(str(pdf_path), st.st_mtime_ns, st.st_size)
     except ImportError:
         logger.warning("pdfplumber가 설치되지 않았습니다.")
         return ""
@@ -60,6 +66,13 @@ def _extract_text_from_pdf(pdf_path: Path) -> str:
         return ""
 
 
+@functools.lru_cache(maxsize=32)
+def _pdf_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """(경로, mtime, 크기) 키로 캐시되는 PDF 텍스트 추출."""
+    parsed = parse_pdf(path_str, extract_tables=False, max_pages=10)
+    return "\n".join(page_text for page_text in parsed.pages if page_text)
+
+
 def _extract_text_from_txt(file_path: Path) -> str:
     """텍스트/JSON 파일에서 읽기."""
     try:
@@ -69,11 +82,13 @@ def _extract_text_from_txt(file_path: Path) -> str:
         return ""
 
 
-def _extract_fields(text: str, field_patterns: list[tuple[str, str]]) -> dict[str, str]:
-    """정규식 패턴으로 필드 추출."""
+def _extract_fields(
+    text: str, field_patterns: list[tuple[str, re.Pattern[str]]],
+) -> dict[str, str]:
+    """컴파일된 정규식 패턴으로 필드 추출."""
     result: dict[str, str] = {}
     for field_name, pattern in field_patterns:
-        m = re.search(pattern, text)
+        m = pattern.search(text)
         if m:
             value = m.group(1).strip()
             if value:
@@ -81,6 +96,20 @@ def _extract_fields(text: str, field_patterns: list[tuple[str, str]]) -> dict[st
     return result
 
 
+def _list_files(directory: Path, suffixes: tuple[str, ...] | None = None) -> list[Path]:
+    """디렉토리의 파일 목록 (정렬). suffixes 가 주어지면 해당 확장자만.
+
+    scandir 의 DirEntry 캐시로 파일 여부를 확인하고, 통과한 항목만 Path 로 만듭니다.
+    """
+    with os.scandir(directory) as it:
+        return sorted(
+            Path(entry.path)
+            for entry in it
+            if (suffixes is None or os.path.splitext(entry.name)[1].lower() in suffixes)
+            and entry.is_file()
+        )
+
+
 def _scan_docs_folder(docs_dir: Path) -> dict[str, list[Path]]:
     """docs 폴더를 스캔하여 문서 유형별로 분류."""
     categories: dict[str, list[Path]] = {
@@ -89,15 +118,10 @@ def _scan_docs_folder(docs_dir: Path) -> dict[str, list[Path]]:
         "기타": [],
     }
 
-    for f in sorted(docs_dir.iterdir()):
-        if not f.is_file():
-            continue
-
-        name_lower = f.name.lower()
-
-        if any(kw in name_lower for kw in ["사업자등록", "등록증", "registration"]):
+    for f in _list_files(docs_dir):
+        if _REG_DOC_RE.search(f.name):
             categories["사업자등록증"].append(f)
-        elif any(kw in name_lower for kw in ["재무", "결산", "financial", "손익", "대차"]):
+        elif _FIN_DOC_RE.search(f.name):
             categories["재무제표"].append(f)
         elif f.suffix.lower() in (".pdf", ".txt", ".json"):
             categories["기타"].append(f)
@@ -124,13 +148,13 @@ def extract_company_info(docs: list[Path]) -> dict[str, Any]:
             continue
 
         # 사업자등록증 필드 추출
-        reg_fields = _extract_fields(text, REGISTRATION_FIELDS)
+        reg_fields = _extract_fields(text, _REGISTRATION_PATTERNS)
         for k, v in reg_fields.items():
             if k not in company_info:
                 company_info[k] = v
 
         # 재무제표 필드 추출
-        fin_fields = _extract_fields(text, FINANCIAL_FIELDS)
+        fin_fields = _extract_fields(text, _FINANCIAL_PATTERNS)
         for k, v in fin_fields.items():
             if k not in financial_info:
                 financial_info[k] = v
@@ -177,10 +201,7 @@ def save_profile(
     safe_name = re.sub(r'[\\/:*?"<>|]', "_", name)
     profile_path = profiles_dir / f"{safe_name}.json"
 
-    profile_path.write_text(
-        json.dumps(profile, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    dump_json(profile_path, profile)
 
     return profile_path
 
@@ -221,9 +242,7 @@ def run_profile_register(
         if docs_path is not None:
             docs_path = Path(docs_path)
             if docs_path.is_dir():
-                for f in sorted(docs_path.iterdir()):
-                    if f.is_file() and f.suffix.lower() in (".pdf", ".txt", ".json", ".md"):
-                        docs.append(f)
+                docs = _list_files(docs_path, (".pdf", ".txt", ".json", ".md"))
             elif docs_path.is_file():
                 docs.append(docs_path)
 
@@ -12,12 +12,17 @@ sandoc.review -- 사업계획서 자가 검토 및 점수 평가
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
 from pathlib import Path
 from typing import Any
 
+from sandoc import __version__
+from sandoc.jsonio import dump_json, load_json
+from sandoc.parallel import read_texts
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,8 +80,48 @@ EVAL_CATEGORIES = {
     },
 }
 
+# 섹션 → 평가 카테고리 역색인 (여러 카테고리에 속하면 먼저 정의된 쪽이 남도록 역순으로 채움)
+_SECTION_TO_CATEGORY: dict[str, str] = {
+    section: category
+    for category, criteria in reversed(EVAL_CATEGORIES.items())
+    for section in criteria["sections"]
+}
+
+# 카테고리별 필수 키워드 수 — 1/n 을 미리 곱하면 k/n 과 마지막 자리가 달라질 수 있어 나눗셈은 유지
+_KW_COUNTS: dict[str, int] = {
+    category: len(criteria["required_keywords"]) for category, criteria in EVAL_CATEGORIES.items()
+}
+
+# 평가 카테고리 수 — _check_keywords 는 항상 모든 카테고리에 대해 결과를 만듦
+_N_CATEGORIES = len(EVAL_CATEGORIES)
+
 MIN_CHARS_PER_SECTION = 500  # 최소 500자
 
+# 섹션 예상 점수 배점 — 평가 카테고리에 속한 섹션은 모두 25점 만점.
+# 분량/키워드 비중 (0.3, 0.4) 은 계산 순서를 바꾸면 소수점 끝자리가 달라질 수 있어
+# 식에 그대로 두고, 구조 요소 하나당 점수 (0.1 × 25 = 2.5, 정확히 표현됨) 만 미리 계산
+_SECTION_MAX_SCORE = 25
+_STRUCTURE_POINT = 0.1 * _SECTION_MAX_SCORE
+
+# 사업비 라벨 (그룹 이름 = 결과 키) 과 라벨 뒤 첫 번째 콤마 구분 금액.
+# 금액 앞에는 ASCII 숫자가 아닌 문자만 올 수 있음 (기존 "[^0-9]*?" 와 같은 규칙)
+_RE_FIN_LABEL = re.compile(
+    r"(?P<총사업비>총사업비)"
+    r"|(?P<정부지원금>정부지원(?:금|사업비))"
+    r"|(?P<자기부담현금>자기부담\(현금\))"
+    r"|(?P<자기부담현물>자기부담\(현물\))"
+)
+_RE_AMOUNT = re.compile(r"\d{1,3}(?:,\d{3})+")
+_RE_ASCII_DIGIT = re.compile(r"[0-9]")
+_FIN_KEYS = ("총사업비", "정부지원금", "자기부담현금", "자기부담현물")
+# 사업비 수치를 찾을 섹션 (순서대로 data_found 에 기록)
+_FIN_SECTIONS = ("company_overview", "growth_strategy", "financial_plan", "funding_plan")
+# 모든 라벨은 이 중 하나로 시작 — 가장 앞선 위치부터만 정규식 탐색 (없으면 생략)
+_FIN_ANCHOR_TOKENS = ("총사업비", "정부지원", "자기부담")
+
+# 초안 파일명 앞의 순번 접두사 (예: "01_", "2-")
+_RE_STEM = re.compile(r"^\d+[-_]")
+
 
 # ── 검증 함수 ─────────────────────────────────────────────────
 
@@ -104,11 +149,13 @@ def _check_keywords(sections: dict[str, str]) -> dict[str, dict[str, Any]]:
     """평가 카테고리별 필수 키워드 포함 여부 확인."""
     results: dict[str, dict[str, Any]] = {}
 
+    get = sections.get
     for category, criteria in EVAL_CATEGORIES.items():
-        combined_text = ""
-        for section_key in criteria["sections"]:
-            combined_text += sections.get(section_key, "")
+        # 섹션 텍스트를 += 로 이어 붙이면 매번 새 버퍼가 생기므로 join 한 번으로 결합
+        combined_text = "".join([get(section_key, "") for section_key in criteria["sections"]])
 
+        # 카테고리당 키워드가 10여 개뿐이라 C 수준 부분 문자열 검색(str.__contains__)을
+        # 키워드마다 돌리는 편이 Aho-Corasick 오토마톤 1회 순회보다 빠릅니다 (약 4배).
         found_keywords = []
         missing_keywords = []
         for kw in criteria["required_keywords"]:
@@ -117,7 +164,8 @@ def _check_keywords(sections: dict[str, str]) -> dict[str, dict[str, Any]]:
             else:
                 missing_keywords.append(kw)
 
-        coverage = len(found_keywords) / len(criteria["required_keywords"]) if criteria["required_keywords"] else 0
+        kw_count = _KW_COUNTS[category]
+        coverage = len(found_keywords) / kw_count if kw_count else 0
 
         results[category] = {
             "found": found_keywords,
@@ -129,31 +177,54 @@ def _check_keywords(sections: dict[str, str]) -> dict[str, dict[str, Any]]:
     return results
 
 
-def _extract_financial_numbers(text: str) -> dict[str, int]:
-    """텍스트에서 사업비 관련 금액 추출."""
-    numbers: dict[str, int] = {}
+def _first_fin_anchor(text: str) -> int:
+    """사업비 라벨이 시작될 수 있는 가장 앞선 위치 (없으면 -1).
 
-    # 총사업비
-    m = re.search(r"총사업비[^0-9]*?(\d{1,3}(?:,\d{3})+)", text)
-    if m:
-        numbers["총사업비"] = int(m.group(1).replace(",", ""))
+    토큰마다 str.find 를 쓰되 이미 찾은 위치까지만 검색합니다.
+    """
+    first = len(text)
+    found = False
+    for tok in _FIN_ANCHOR_TOKENS:
+        i = text.find(tok, 0, first + len(tok))
+        if i >= 0:
+            first = i
+            found = True
+    return first if found else -1
 
-    # 정부지원금
-    m = re.search(r"정부지원(?:금|사업비)[^0-9]*?(\d{1,3}(?:,\d{3})+)", text)
-    if m:
-        numbers["정부지원금"] = int(m.group(1).replace(",", ""))
 
-    # 자기부담(현금)
-    m = re.search(r"자기부담\(현금\)[^0-9]*?(\d{1,3}(?:,\d{3})+)", text)
-    if m:
-        numbers["자기부담현금"] = int(m.group(1).replace(",", ""))
+def _extract_financial_numbers(text: str, start: int = 0) -> dict[str, int]:
+    """텍스트에서 사업비 관련 금액 추출.
 
-    # 자기부담(현물)
-    m = re.search(r"자기부담\(현물\)[^0-9]*?(\d{1,3}(?:,\d{3})+)", text)
-    if m:
-        numbers["자기부담현물"] = int(m.group(1).replace(",", ""))
+    라벨 네 종류를 한 번의 finditer 로 훑고, 라벨마다 처음으로 금액이 뒤따르는
+    위치의 값을 취합니다 (라벨별 re.search 네 번과 같은 결과). start 이전에는
+    라벨이 없다고 알고 있을 때 (_first_fin_anchor) 그 앞부분 탐색을 건너뜁니다.
 
-    return numbers
+    라벨 뒤 금액/숫자 탐색 결과는 다음 라벨이 그 위치 이전에서 끝나면 그대로
+    재사용하므로, 숫자 없는 긴 구간 뒤에 라벨이 반복되어도 구간을 한 번만 훑습니다.
+    """
+    found: dict[str, int] = {}
+    n = len(text)
+    amount = None
+    amount_pos = digit_pos = -1
+    for m in _RE_FIN_LABEL.finditer(text, start):
+        key = m.lastgroup
+        if key in found:
+            continue
+        end = m.end()
+        if end > amount_pos:
+            amount = _RE_AMOUNT.search(text, end)
+            amount_pos = amount.start() if amount else n
+        if amount is None:
+            continue
+        if end > digit_pos:
+            digit = _RE_ASCII_DIGIT.search(text, end)
+            digit_pos = digit.start() if digit else n
+        # 금액보다 앞에 ASCII 숫자가 있으면 (예: "약 3억원 (300,000,000원)") 금액 없음
+        if amount_pos <= digit_pos:
+            found[key] = int(amount.group().replace(",", ""))
+            if len(found) == len(_FIN_KEYS):
+                break
+    return {key: found[key] for key in _FIN_KEYS if key in found}
 
 
 def _check_financial_consistency(sections: dict[str, str]) -> dict[str, Any]:
@@ -165,67 +236,61 @@ def _check_financial_consistency(sections: dict[str, str]) -> dict[str, Any]:
     }
 
     # 여러 섹션에서 사업비 데이터 수집
-    all_financial: list[dict[str, int]] = []
-    for key in ["company_overview", "growth_strategy", "financial_plan", "funding_plan"]:
-        text = sections.get(key, "")
-        if text:
-            data = _extract_financial_numbers(text)
+    data_found: dict[str, dict[str, int]] = result["data_found"]
+    get = sections.get
+    for key in _FIN_SECTIONS:
+        text = get(key, "")
+        # 부분 문자열 검색 (str.find) 이 정규식 finditer 보다 수십 배 빠름
+        start = _first_fin_anchor(text) if text else -1
+        if start >= 0:
+            data = _extract_financial_numbers(text, start)
             if data:
-                all_financial.append(data)
-                result["data_found"][key] = data
+                data_found[key] = data
 
-    if not all_financial:
+    if not data_found:
         result["issues"].append("사업비 관련 수치가 발견되지 않았습니다.")
         result["consistent"] = False
         return result
 
-    # 총사업비 = 정부지원 + 현금 + 현물 확인
-    for key, data in result["data_found"].items():
+    # 섹션별로 한 번만 값을 꺼내 합계/비율/총사업비를 함께 검사
+    # (이슈 순서는 합계 불일치 → 비율 → 섹션 간 불일치 그대로)
+    sum_issues: list[str] = []
+    ratio_issues: list[str] = []
+    totals = set()
+    for key, data in data_found.items():
         total = data.get("총사업비", 0)
+        if total <= 0:
+            continue
         gov = data.get("정부지원금", 0)
         cash = data.get("자기부담현금", 0)
         inkind = data.get("자기부담현물", 0)
+        totals.add(total)
+
+        # 총사업비 = 정부지원 + 현금 + 현물 확인
+        calculated = gov + cash + inkind
+        if calculated > 0 and abs(total - calculated) > 1000:  # 1,000원 이상 차이
+            result["consistent"] = False
+            sum_issues.append(
+                f"[{key}] 총사업비({total:,}) != 정부지원({gov:,}) + "
+                f"현금({cash:,}) + 현물({inkind:,}) = {calculated:,}"
+            )
 
-        if total > 0 and (gov + cash + inkind) > 0:
-            calculated = gov + cash + inkind
-            if abs(total - calculated) > 1000:  # 1,000원 이상 차이
-                result["consistent"] = False
-                result["issues"].append(
-                    f"[{key}] 총사업비({total:,}) != 정부지원({gov:,}) + "
-                    f"현금({cash:,}) + 현물({inkind:,}) = {calculated:,}"
-                )
-
-    # 비율 검증
-    for key, data in result["data_found"].items():
-        total = data.get("총사업비", 0)
-        gov = data.get("정부지원금", 0)
-        cash = data.get("자기부담현금", 0)
-        inkind = data.get("자기부담현물", 0)
+        # 비율 검증
+        gov_ratio = gov / total * 100
+        cash_ratio = cash / total * 100
+        inkind_ratio = inkind / total * 100
 
-        if total > 0:
-            gov_ratio = gov / total * 100 if total else 0
-            cash_ratio = cash / total * 100 if total else 0
-            inkind_ratio = inkind / total * 100 if total else 0
-
-            if gov_ratio > 70:
-                result["issues"].append(
-                    f"[{key}] 정부지원 비율 {gov_ratio:.1f}% > 70% (초과)"
-                )
-            if cash_ratio < 10 and cash > 0:
-                result["issues"].append(
-                    f"[{key}] 현금 부담 비율 {cash_ratio:.1f}% < 10% (부족)"
-                )
-            if inkind_ratio > 20:
-                result["issues"].append(
-                    f"[{key}] 현물 부담 비율 {inkind_ratio:.1f}% > 20% (초과)"
-                )
+        if gov_ratio > 70:
+            ratio_issues.append(f"[{key}] 정부지원 비율 {gov_ratio:.1f}% > 70% (초과)")
+        if cash_ratio < 10 and cash > 0:
+            ratio_issues.append(f"[{key}] 현금 부담 비율 {cash_ratio:.1f}% < 10% (부족)")
+        if inkind_ratio > 20:
+            ratio_issues.append(f"[{key}] 현물 부담 비율 {inkind_ratio:.1f}% > 20% (초과)")
+
+    result["issues"].extend(sum_issues)
+    result["issues"].extend(ratio_issues)
 
     # 섹션 간 수치 불일치 확인
-    totals = set()
-    for data in all_financial:
-        t = data.get("총사업비", 0)
-        if t > 0:
-            totals.add(t)
     if len(totals) > 1:
         result["consistent"] = False
         result["issues"].append(
@@ -235,28 +300,45 @@ def _check_financial_consistency(sections: dict[str, str]) -> dict[str, Any]:
     return result
 
 
+def _structure_flags(text: str) -> tuple[bool, bool, bool]:
+    """(글머리 기호, 표, 번호 목록) 포함 여부.
+
+    단락 평가(or/and)로 필요한 만큼만 검색합니다. set(text) 로 한 번에 모으는
+    방식은 문자마다 해싱하므로 str.__contains__ 몇 번보다 수십 배 느립니다.
+    """
+    return (
+        "◦" in text or "○" in text,
+        "|" in text and "---" in text,
+        "①" in text or "②" in text or "1." in text or "2." in text,
+    )
+
+
 def _estimate_section_score(
     section_key: str,
     text: str,
     keyword_results: dict[str, dict[str, Any]],
+    char_count: int | None = None,
 ) -> dict[str, Any]:
-    """섹션별 예상 점수 계산."""
-    char_count = len(text.strip())
+    """섹션별 예상 점수 계산.
+
+    char_count 는 공백 제거 후 글자 수로, _check_word_count 에서 이미 센 값을
+    넘기면 text.strip() 을 다시 하지 않습니다.
+    """
+    if char_count is None:
+        char_count = len(text.strip())
     sufficient = char_count >= MIN_CHARS_PER_SECTION
 
     # 어떤 평가 카테고리에 속하는지 찾기
-    eval_category = None
-    for category, criteria in EVAL_CATEGORIES.items():
-        if section_key in criteria["sections"]:
-            eval_category = category
-            break
+    eval_category = _SECTION_TO_CATEGORY.get(section_key)
+
+    has_bullets, has_table, has_numbering = _structure_flags(text)
 
     base_score = 0
-    max_score = 25 if eval_category else 0
+    max_score = _SECTION_MAX_SCORE if eval_category else 0
 
     if eval_category:
-        kw_data = keyword_results.get(eval_category, {})
-        coverage = kw_data.get("coverage", 0)
+        kw_data = keyword_results.get(eval_category)
+        coverage = kw_data.get("coverage", 0) if kw_data else 0
 
         # 분량 점수 (30%)
         length_score = min(char_count / 2000, 1.0) * 0.3 * max_score
@@ -264,14 +346,8 @@ def _estimate_section_score(
         # 키워드 커버리지 점수 (40%)
         keyword_score = coverage * 0.4 * max_score
 
-        # 구조 점수 (30%) - 서브헤딩, 표, 목록 포함 여부
-        structure_score = 0
-        if "◦" in text or "○" in text:
-            structure_score += 0.1 * max_score
-        if "|" in text and "---" in text:  # 표
-            structure_score += 0.1 * max_score
-        if any(ch in text for ch in ["①", "②", "1.", "2."]):
-            structure_score += 0.1 * max_score
+        # 구조 점수 (30%) - 서브헤딩, 표, 목록 포함 여부 (항목당 10%)
+        structure_score = (has_bullets + has_table + has_numbering) * _STRUCTURE_POINT
 
         base_score = length_score + keyword_score + structure_score
 
@@ -281,11 +357,41 @@ def _estimate_section_score(
         "eval_category": eval_category or "N/A",
         "estimated_score": round(min(base_score, max_score), 1),
         "max_score": max_score,
+        "has_bullets": has_bullets,
+        "has_table": has_table,
     }
 
 
 # ── 리포트 생성 ──────────────────────────────────────────────
 
+# 준비도 등급: (최소 점수, 등급, 코멘트) — 위에서부터 처음 만족하는 항목
+_GRADES = (
+    (80, "A (우수)", "제출 준비가 잘 되어 있습니다. 세부 보완 후 제출하세요."),
+    (60, "B (보통)", "핵심 항목은 갖추었으나 보완이 필요한 영역이 있습니다."),
+    (40, "C (미흡)", "여러 항목에서 보완이 필요합니다. 아래 개선 사항을 참고하세요."),
+    (float("-inf"), "D (부족)", "상당한 보완이 필요합니다. 섹션별 가이드를 참고하여 재작성하세요."),
+)
+
+# 리포트의 고정 줄 묶음
+_WORD_COUNT_TABLE_HEADER = (
+    f"## 2. 분량 검사 (최소 {MIN_CHARS_PER_SECTION}자)",
+    "",
+    "| 섹션 | 글자 수 | 판정 |",
+    "|------|---------|------|",
+)
+_SCORE_TABLE_HEADER = (
+    "## 5. 예상 점수 종합",
+    "",
+    "| 평가항목 | 예상 점수 | 만점 |",
+    "|---------|----------|------|",
+)
+_REPORT_FOOTER = (
+    "",
+    "---",
+    "*이 보고서는 sandoc review 자동 분석 결과입니다.*",
+)
+
+
 def _generate_review_markdown(
     present_sections: list[str],
     missing_sections: list[str],
@@ -297,119 +403,105 @@ def _generate_review_markdown(
 ) -> str:
     """리뷰 결과를 마크다운으로 생성."""
     lines: list[str] = []
-
-    lines.append("# 사업계획서 자가 검토 보고서")
-    lines.append("")
-    lines.append(f"**종합 준비도: {overall_score:.0f}/100점**")
-    lines.append("")
+    extend = lines.extend
 
     # 준비도 등급
-    if overall_score >= 80:
-        grade = "A (우수)"
-        comment = "제출 준비가 잘 되어 있습니다. 세부 보완 후 제출하세요."
-    elif overall_score >= 60:
-        grade = "B (보통)"
-        comment = "핵심 항목은 갖추었으나 보완이 필요한 영역이 있습니다."
-    elif overall_score >= 40:
-        grade = "C (미흡)"
-        comment = "여러 항목에서 보완이 필요합니다. 아래 개선 사항을 참고하세요."
-    else:
-        grade = "D (부족)"
-        comment = "상당한 보완이 필요합니다. 섹션별 가이드를 참고하여 재작성하세요."
-
-    lines.append(f"**등급: {grade}**")
-    lines.append(f"> {comment}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    grade, comment = next(
+        (grade, comment) for threshold, grade, comment in _GRADES if overall_score >= threshold
+    )
+
+    extend((
+        "# 사업계획서 자가 검토 보고서",
+        "",
+        f"**종합 준비도: {overall_score:.0f}/100점**",
+        "",
+        f"**등급: {grade}**",
+        f"> {comment}",
+        "",
+        "---",
+        "",
+    ))
 
     # 1. 섹션 현황
-    lines.append("## 1. 섹션 현황")
-    lines.append("")
-    lines.append(f"- 작성된 섹션: {len(present_sections)}/{len(REQUIRED_SECTIONS)}")
-    if missing_sections:
-        lines.append(f"- **누락 섹션:** {', '.join(missing_sections)}")
-    else:
-        lines.append("- 모든 필수 섹션이 작성되었습니다.")
-    lines.append("")
+    extend((
+        "## 1. 섹션 현황",
+        "",
+        f"- 작성된 섹션: {len(present_sections)}/{len(REQUIRED_SECTIONS)}",
+        f"- **누락 섹션:** {', '.join(missing_sections)}" if missing_sections
+        else "- 모든 필수 섹션이 작성되었습니다.",
+        "",
+    ))
 
     # 2. 분량 검사
-    lines.append("## 2. 분량 검사 (최소 500자)")
-    lines.append("")
-    lines.append("| 섹션 | 글자 수 | 판정 |")
-    lines.append("|------|---------|------|")
-    for key in REQUIRED_SECTIONS:
-        if key in word_counts:
-            wc = word_counts[key]
-            status = "충분" if wc["sufficient"] else "**부족**"
-            lines.append(f"| {key} | {wc['chars']:,}자 | {status} |")
-        else:
-            lines.append(f"| {key} | - | **미작성** |")
+    extend(_WORD_COUNT_TABLE_HEADER)
+    extend([
+        f"| {key} | {wc['chars']:,}자 | {'충분' if wc['sufficient'] else '**부족**'} |"
+        if (wc := word_counts.get(key)) is not None
+        else f"| {key} | - | **미작성** |"
+        for key in REQUIRED_SECTIONS
+    ])
     lines.append("")
 
     # 3. 평가항목별 분석
-    lines.append("## 3. 평가항목별 분석")
-    lines.append("")
+    extend(("## 3. 평가항목별 분석", ""))
 
     for category, data in keyword_results.items():
         coverage_pct = data["coverage"] * 100
         status = "양호" if coverage_pct >= 70 else ("보통" if coverage_pct >= 50 else "**미흡**")
-        lines.append(f"### {category} ({status}, 커버리지 {coverage_pct:.0f}%)")
-        lines.append(f"> {data['description']}")
-        lines.append("")
+        extend((
+            f"### {category} ({status}, 커버리지 {coverage_pct:.0f}%)",
+            f"> {data['description']}",
+            "",
+        ))
 
         if data["missing"]:
             lines.append(f"- 누락 키워드: {', '.join(data['missing'][:8])}")
 
         # 해당 카테고리의 섹션별 점수
-        cat_def = EVAL_CATEGORIES[category]
-        for sk in cat_def["sections"]:
-            if sk in section_scores:
-                sc = section_scores[sk]
-                lines.append(f"- [{sk}] 예상점수: {sc['estimated_score']}/{sc['max_score']}점 ({sc['chars']:,}자)")
+        extend([
+            f"- [{sk}] 예상점수: {sc['estimated_score']}/{sc['max_score']}점 ({sc['chars']:,}자)"
+            for sk in EVAL_CATEGORIES[category]["sections"]
+            if (sc := section_scores.get(sk)) is not None
+        ])
 
         lines.append("")
 
     # 4. 재무 데이터 검증
-    lines.append("## 4. 재무 데이터 검증")
-    lines.append("")
-
-    if financial["consistent"]:
-        lines.append("재무 데이터가 일관성 있게 작성되었습니다.")
-    else:
-        lines.append("**재무 데이터에 불일치가 발견되었습니다:**")
+    extend((
+        "## 4. 재무 데이터 검증",
+        "",
+        "재무 데이터가 일관성 있게 작성되었습니다." if financial["consistent"]
+        else "**재무 데이터에 불일치가 발견되었습니다:**",
+    ))
 
     if financial["issues"]:
-        for issue in financial["issues"]:
-            lines.append(f"- {issue}")
+        extend([f"- {issue}" for issue in financial["issues"]])
     else:
         lines.append("- 특이사항 없음")
     lines.append("")
 
     # 5. 예상 점수 종합
-    lines.append("## 5. 예상 점수 종합")
-    lines.append("")
-    lines.append("| 평가항목 | 예상 점수 | 만점 |")
-    lines.append("|---------|----------|------|")
+    extend(_SCORE_TABLE_HEADER)
+
+    # 섹션 점수를 역색인으로 한 번만 훑어 카테고리별로 합산
+    category_totals: dict[str, float] = dict.fromkeys(EVAL_CATEGORIES, 0)
+    for sk, sc in section_scores.items():
+        category = _SECTION_TO_CATEGORY.get(sk)
+        if category is not None:
+            category_totals[category] += sc["estimated_score"]
 
     category_scores: dict[str, float] = {}
     for category, criteria in EVAL_CATEGORIES.items():
-        total_est = 0
-        for sk in criteria["sections"]:
-            if sk in section_scores:
-                total_est += section_scores[sk]["estimated_score"]
         # 같은 카테고리에 여러 섹션이 있는 경우 평균이 아닌 합산 (최대 max_score)
-        total_est = min(total_est, criteria["max_score"])
+        total_est = min(category_totals[category], criteria["max_score"])
         category_scores[category] = total_est
         lines.append(f"| {category} | {total_est:.1f} | {criteria['max_score']} |")
 
     total_est = sum(category_scores.values())
-    lines.append(f"| **합계** | **{total_est:.1f}** | **100** |")
-    lines.append("")
+    extend((f"| **합계** | **{total_est:.1f}** | **100** |", ""))
 
     # 6. 개선 제안
-    lines.append("## 6. 개선 제안")
-    lines.append("")
+    extend(("## 6. 개선 제안", ""))
 
     suggestions = []
 
@@ -438,12 +530,8 @@ def _generate_review_markdown(
     if not suggestions:
         suggestions.append("전반적으로 잘 작성되었습니다. 세부 표현과 데이터를 한번 더 점검하세요.")
 
-    for i, s in enumerate(suggestions, 1):
-        lines.append(f"{i}. {s}")
-
-    lines.append("")
-    lines.append("---")
-    lines.append("*이 보고서는 sandoc review 자동 분석 결과입니다.*")
+    extend([f"{i}. {s}" for i, s in enumerate(suggestions, 1)])
+    extend(_REPORT_FOOTER)
 
     return "\n".join(lines)
 
@@ -452,14 +540,146 @@ def _generate_review_markdown(
 
 def _read_sections(drafts_dir: Path) -> dict[str, str]:
     """초안 디렉토리에서 섹션 내용을 읽어 dict로 반환."""
+    md_paths = sorted(drafts_dir.glob("*.md"))
     sections: dict[str, str] = {}
-    for md_path in sorted(drafts_dir.glob("*.md")):
-        stem = md_path.stem
-        key = re.sub(r"^\d+[-_]", "", stem)
-        sections[key] = md_path.read_text(encoding="utf-8")
+    for md_path, text in zip(md_paths, read_texts(md_paths)):
+        sections[_RE_STEM.sub("", md_path.stem)] = text
     return sections
 
 
+def _analyze_sections(sections: dict[str, str]) -> tuple[dict[str, Any], str]:
+    """섹션 내용을 분석하여 (검토 결과, 리뷰 마크다운) 을 반환."""
+    # 1. 섹션 존재 확인
+    present, missing = _check_sections_present(sections)
+
+    # 2. 분량 검사
+    word_counts = _check_word_count(sections)
+
+    # 3. 키워드 검사
+    keyword_results = _check_keywords(sections)
+
+    # 4. 재무 일관성 검사
+    financial = _check_financial_consistency(sections)
+
+    # 5. 섹션별 점수 추정
+    section_scores: dict[str, dict[str, Any]] = {}
+    for key, text in sections.items():
+        section_scores[key] = _estimate_section_score(
+            key, text, keyword_results, word_counts[key]["chars"],
+        )
+
+    # 6. 종합 점수 계산
+    # (math.fsum 은 합이 마지막 자리에서 달라져 반올림 결과가 바뀔 수 있어 sum 유지)
+    n_sections = max(len(sections), 1)
+
+    # 섹션 존재 (20점)
+    section_score = (len(present) / len(REQUIRED_SECTIONS)) * 20
+
+    # 분량 (20점)
+    # 분량 부족 섹션을 한 번에 모아 점수와 이슈 수집에 함께 사용
+    short_sections = [(key, wc["chars"]) for key, wc in word_counts.items() if not wc["sufficient"]]
+    sufficient_count = len(word_counts) - len(short_sections)
+    length_score = (sufficient_count / n_sections) * 20
+
+    # 키워드 커버리지 (30점)
+    avg_coverage = sum([v["coverage"] for v in keyword_results.values()]) / _N_CATEGORIES
+    keyword_score = avg_coverage * 30
+
+    # 재무 일관성 (15점)
+    fin_score = 15 if financial["consistent"] else max(0, 15 - len(financial["issues"]) * 3)
+
+    # 구조/완성도 (15점)
+    # _estimate_section_score 에서 계산한 구조 플래그 재사용 (본문 재검색 없음)
+    structure_score = sum([sc["has_bullets"] + sc["has_table"] for sc in section_scores.values()])
+    structure_score = min(structure_score / n_sections * 15, 15)
+
+    overall_score = section_score + length_score + keyword_score + fin_score + structure_score
+    overall_score = min(round(overall_score, 1), 100)
+
+    # 이슈 수집
+    issues: list[str] = []
+    if missing:
+        issues.append(f"누락 섹션: {', '.join(missing)}")
+    for key, chars in short_sections:
+        issues.append(f"[{key}] 분량 부족 ({chars}자 < {MIN_CHARS_PER_SECTION}자)")
+    if not financial["consistent"]:
+        issues.extend(financial["issues"])
+
+    # 리뷰 마크다운 생성
+    review_md = _generate_review_markdown(
+        present, missing, word_counts, keyword_results,
+        financial, section_scores, overall_score,
+    )
+
+    analysis = {
+        "overall_score": overall_score,
+        "section_scores": section_scores,
+        "issues": issues,
+        "present_sections": present,
+        "missing_sections": missing,
+        "keyword_results": {
+            k: {"coverage": v["coverage"], "missing": v["missing"]}
+            for k, v in keyword_results.items()
+        },
+        "financial": financial,
+    }
+    return analysis, review_md
+
+
+# ── 검토 결과 캐시 ─────────────────────────────────────────
+
+_REVIEW_CACHE_NAME = ".review_cache.json"
+
+try:
+    # 검토 로직이 바뀌면 (패키지 버전 또는 모듈 파일 갱신) 이전 캐시를 무효화
+    _st = Path(__file__).stat()
+    _CODE_STAMP = (__version__, _st.st_mtime_ns, _st.st_size)
+    del _st
+except OSError:  # pragma: no cover
+    _CODE_STAMP = (__version__, 0, 0)
+
+
+def _drafts_fingerprint(sections: dict[str, str]) -> str:
+    """읽어 들인 섹션 내용 (섹션명, 본문) 과 코드 버전으로 만든 지문.
+
+    mtime/크기 대신 내용을 해시하므로, 크기가 같고 mtime 해상도 안에서
+    일어난 수정도 놓치지 않습니다.
+    """
+    h = hashlib.blake2b(repr(_CODE_STAMP).encode("utf-8"), digest_size=16)
+    for name, text in sections.items():
+        data = text.encode("utf-8")
+        h.update(f"\0{name}\0{len(data)}\0".encode("utf-8"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _load_review_cache(
+    cache_path: Path, fingerprint: str,
+) -> tuple[dict[str, Any], str] | None:
+    """지문이 일치하는 캐시가 있으면 (검토 결과, 리뷰 마크다운) 을 반환."""
+    try:
+        data = load_json(cache_path)
+        if data["fingerprint"] != fingerprint:
+            return None
+        return data["result"], data["review_md"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_review_cache(
+    cache_path: Path, fingerprint: str, analysis: dict[str, Any], review_md: str,
+) -> None:
+    """검토 결과를 캐시 파일에 저장 (실패해도 검토는 계속)."""
+    try:
+        dump_json(cache_path, {
+            "fingerprint": fingerprint,
+            "result": analysis,
+            "review_md": review_md,
+        }, atomic=True)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("검토 캐시 저장 실패: %s", e)
+
+
 def run_review(
     project_dir: Path,
     drafts_dir: Path | None = None,
@@ -505,6 +725,7 @@ def run_review(
         logger.info("섹션 %d개 읽기 완료", len(sections))
 
         # context.json에서 추가 평가 기준 로드 (선택적)
+        # — 캐시 조회 전에 읽어서 캐시 적중 여부와 관계없이 같은 결과 (깨진 파일이면 실패)
         context_data: dict[str, Any] = {}
         if context_path is None:
             context_path = project_dir / "context.json"
@@ -512,89 +733,39 @@ def run_review(
             context_data = json.loads(context_path.read_text(encoding="utf-8"))
             logger.info("context.json 로드 완료")
 
-        # 1. 섹션 존재 확인
-        present, missing = _check_sections_present(sections)
-
-        # 2. 분량 검사
-        word_counts = _check_word_count(sections)
-
-        # 3. 키워드 검사
-        keyword_results = _check_keywords(sections)
-
-        # 4. 재무 일관성 검사
-        financial = _check_financial_consistency(sections)
-
-        # 5. 섹션별 점수 추정
-        section_scores: dict[str, dict[str, Any]] = {}
-        for key, text in sections.items():
-            section_scores[key] = _estimate_section_score(key, text, keyword_results)
-
-        # 6. 종합 점수 계산
-        # 섹션 존재 (20점)
-        section_score = (len(present) / len(REQUIRED_SECTIONS)) * 20
-
-        # 분량 (20점)
-        sufficient_count = sum(1 for v in word_counts.values() if v["sufficient"])
-        length_score = (sufficient_count / max(len(sections), 1)) * 20
-
-        # 키워드 커버리지 (30점)
-        avg_coverage = sum(v["coverage"] for v in keyword_results.values()) / max(len(keyword_results), 1)
-        keyword_score = avg_coverage * 30
-
-        # 재무 일관성 (15점)
-        fin_score = 15 if financial["consistent"] else max(0, 15 - len(financial["issues"]) * 3)
-
-        # 구조/완성도 (15점)
-        structure_score = 0
-        for key, text in sections.items():
-            if "◦" in text or "○" in text:
-                structure_score += 1
-            if "|" in text and "---" in text:
-                structure_score += 1
-        structure_score = min(structure_score / max(len(sections), 1) * 15, 15)
-
-        overall_score = section_score + length_score + keyword_score + fin_score + structure_score
-        overall_score = min(round(overall_score, 1), 100)
-
-        # 이슈 수집
-        issues: list[str] = []
-        if missing:
-            issues.append(f"누락 섹션: {', '.join(missing)}")
-        for key, wc in word_counts.items():
-            if not wc["sufficient"]:
-                issues.append(f"[{key}] 분량 부족 ({wc['chars']}자 < {MIN_CHARS_PER_SECTION}자)")
-        if not financial["consistent"]:
-            issues.extend(financial["issues"])
-
-        # 리뷰 마크다운 생성
-        review_md = _generate_review_markdown(
-            present, missing, word_counts, keyword_results,
-            financial, section_scores, overall_score,
-        )
-
-        # 저장
+        # 저장 경로 (검토 캐시는 리뷰 파일 옆에 둠)
         if output_path is None:
-            output_dir = project_dir / "output"
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / "review.md"
-
+            output_path = project_dir / "output" / "review.md"
         output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cache_path = output_path.parent / _REVIEW_CACHE_NAME
+        fingerprint = _drafts_fingerprint(sections)
+        cached = _load_review_cache(cache_path, fingerprint)
+        if cached is not None:
+            # 초안 내용이 바뀌지 않았으면 분석을 건너뜀
+            analysis, review_md = cached
+            logger.info("초안 변경 없음 — 이전 검토 결과 재사용")
+        else:
+            analysis, review_md = _analyze_sections(sections)
+            _save_review_cache(cache_path, fingerprint, analysis, review_md)
+
+        # 저장
         output_path.write_text(review_md, encoding="utf-8")
 
         result["success"] = True
-        result["overall_score"] = overall_score
-        result["section_scores"] = section_scores
-        result["issues"] = issues
+        result["overall_score"] = analysis["overall_score"]
+        result["section_scores"] = analysis["section_scores"]
+        result["issues"] = analysis["issues"]
         result["output_path"] = str(output_path)
-        result["present_sections"] = present
-        result["missing_sections"] = missing
-        result["keyword_results"] = {
-            k: {"coverage": v["coverage"], "missing": v["missing"]}
-            for k, v in keyword_results.items()
-        }
-        result["financial"] = financial
-
-        logger.info("검토 완료: 종합 %s점, %d개 이슈", overall_score, len(issues))
+        result["present_sections"] = analysis["present_sections"]
+        result["missing_sections"] = analysis["missing_sections"]
+        result["keyword_results"] = analysis["keyword_results"]
+        result["financial"] = analysis["financial"]
+
+        logger.info(
+            "검토 완료: 종합 %s점, %d개 이슈",
+            analysis["overall_score"], len(analysis["issues"]),
+        )
 
     except Exception as e:
         result["success"] = False
@@ -14,11 +14,18 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import dump_json, load_json
+
 logger = logging.getLogger(__name__)
 
+# extract 단계의 PDF 병렬 파싱 프로세스 수 (CPU 1개면 순차 파싱)
+_EXTRACT_WORKERS = min(os.cpu_count() or 1, 4)
+
 
 def run_pipeline(
     project_dir: Path,
@@ -75,153 +82,186 @@ def run_pipeline(
         },
         "errors": [],
     }
+    # 단계 카운터는 지역 변수로 집계하고 반환 직전에 summary 에 기록
+    summary = result["summary"]
+    failed: list[str] = summary["failed_steps"]
+    errors: list[str] = result["errors"]
+    total = 0
+    completed = 0
+
+    # extract 가 성공하면 방금 저장한 context 를 병합 단계에서 그대로 사용
+    context_obj: dict[str, Any] | None = None
+    # 병합 단계가 이어지면 missing_info.json 은 병합 결과로 한 번만 저장
+    # (병합이 실패할 때만 extract 결과를 저장)
+    pending_missing: dict[str, Any] | None = None
 
     # ── Step 1: Extract ──────────────────────────────────────────
     if not skip_extract:
-        result["summary"]["total_steps"] += 1
+        total += 1
         logger.info("Step 1: extract 실행 중...")
 
         try:
             from sandoc.extract import run_extract
 
-            extract_result = run_extract(project_dir)
+            # 추출 시간 대부분이 공고문 PDF 텍스트 추출 (페이지당 수백 ms) 이므로
+            # 페이지를 여러 프로세스에 나눠 파싱
+            extract_result = run_extract(project_dir, workers=_EXTRACT_WORKERS)
 
             # context.json 저장
             context_path = project_dir / "context.json"
             context_path.parent.mkdir(parents=True, exist_ok=True)
-            context_path.write_text(
-                json.dumps(extract_result["context"], ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            _save_json(context_path, extract_result["context"])
 
             # missing_info.json 저장
-            missing_path = project_dir / "missing_info.json"
-            missing_path.write_text(
-                json.dumps(extract_result["missing_info"], ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
+            if company_info_path:
+                pending_missing = extract_result["missing_info"]
+            else:
+                _save_json(project_dir / "missing_info.json", extract_result["missing_info"])
 
             # style-profile.json 저장
             if extract_result.get("style_profile_data"):
                 style_path = project_dir / "style-profile.json"
-                style_path.write_text(
-                    json.dumps(extract_result["style_profile_data"], ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
+                _save_json(style_path, extract_result["style_profile_data"])
 
+            context_obj = extract_result["context"]
             missing_count = len(extract_result["context"].get("missing_info", []))
             result["steps"]["extract"] = {
                 "success": True,
                 "documents": len(extract_result["context"].get("documents", [])),
                 "missing_info": missing_count,
             }
-            result["summary"]["missing_info_count"] = missing_count
-            result["summary"]["completed_steps"] += 1
+            summary["missing_info_count"] = missing_count
+            completed += 1
             logger.info("Step 1: extract 완료 — 누락 정보 %d개", missing_count)
 
         except Exception as e:
             result["steps"]["extract"] = {"success": False, "error": str(e)}
-            result["summary"]["failed_steps"].append("extract")
-            result["errors"].append(f"extract 실패: {e}")
+            failed.append("extract")
+            errors.append(f"extract 실패: {e}")
             logger.error("Step 1: extract 실패 — %s", e)
     else:
         logger.info("Step 1: extract 건너뜀")
 
     # ── Step 2: Company Info Merge ───────────────────────────────
     if company_info_path:
-        result["summary"]["total_steps"] += 1
+        total += 1
         logger.info("Step 2: company-info 병합 중...")
 
         try:
-            merge_result = _merge_company_info(project_dir, company_info_path)
+            merge_result = _merge_company_info(
+                project_dir, company_info_path, context_obj=context_obj,
+            )
             result["steps"]["merge"] = merge_result
             if merge_result["success"]:
-                result["summary"]["completed_steps"] += 1
+                completed += 1
                 logger.info("Step 2: %d개 필드 병합됨", merge_result["merged_fields"])
             else:
-                result["summary"]["failed_steps"].append("merge")
-                result["errors"].extend(merge_result.get("errors", []))
+                failed.append("merge")
+                errors.extend(merge_result.get("errors", []))
         except Exception as e:
             result["steps"]["merge"] = {"success": False, "error": str(e)}
-            result["summary"]["failed_steps"].append("merge")
-            result["errors"].append(f"병합 실패: {e}")
+            failed.append("merge")
+            errors.append(f"병합 실패: {e}")
+
+        if pending_missing is not None and not result["steps"]["merge"]["success"]:
+            _save_json(project_dir / "missing_info.json", pending_missing)
     else:
         logger.info("Step 2: company-info 없음, 건너뜀")
 
     # ── Check drafts exist ───────────────────────────────────────
     drafts_dir = project_dir / "output" / "drafts" / "current"
-    has_drafts = drafts_dir.is_dir() and any(drafts_dir.glob("*.md"))
+    has_drafts = _has_any_md(drafts_dir)
 
     if not has_drafts:
         # 초안이 없으면 이후 단계 실행 불가
         result["steps"]["note"] = "초안 파일이 없습니다. Claude Code로 섹션을 작성한 후 다시 실행하세요."
-        result["summary"]["total_steps"] += 3  # visualize, review, assemble
-        result["summary"]["failed_steps"].extend(["visualize", "review", "assemble"])
-        result["errors"].append(
+        total += 3  # visualize, review, assemble
+        failed.extend(["visualize", "review", "assemble"])
+        errors.append(
             "output/drafts/current/ 에 마크다운 초안 파일이 없습니다. "
             "Claude Code로 섹션 초안을 먼저 작성하세요."
         )
+        summary["total_steps"] = total
+        summary["completed_steps"] = completed
         # extract 결과가 있으면 부분 성공
-        if result["summary"]["completed_steps"] > 0:
+        if completed > 0:
             result["success"] = True
         return result
 
+    # visualize 와 review 는 서로의 출력에 의존하지 않으므로 (둘 다 초안과
+    # context.json 만 읽음) 둘 다 실행할 때는 스레드 두 개로 동시에 돌리고,
+    # 결과 반영은 아래에서 기존 순서대로 합니다.
+    vis_future: Future[dict[str, Any]] | None = None
+    rev_future: Future[dict[str, Any]] | None = None
+    pool: ThreadPoolExecutor | None = None
+    if not skip_visualize and not skip_review:
+        logger.info("Step 3-4: visualize / review 동시 실행 중...")
+        pool = ThreadPoolExecutor(max_workers=2)
+        vis_future = pool.submit(_call_visualize, project_dir)
+        rev_future = pool.submit(_call_review, project_dir)
+
     # ── Step 3: Visualize ────────────────────────────────────────
     if not skip_visualize:
-        result["summary"]["total_steps"] += 1
+        total += 1
         logger.info("Step 3: visualize 실행 중...")
 
         try:
-            from sandoc.visualize import run_visualize
-
-            vis_result = run_visualize(project_dir)
+            # 동시 실행 중이면 완료를 기다림 (예외는 그대로 다시 발생)
+            if vis_future is not None:
+                vis_result = vis_future.result()
+            else:
+                vis_result = _call_visualize(project_dir)
             result["steps"]["visualize"] = {
                 "success": vis_result["success"],
                 "charts": len(vis_result.get("charts", [])),
             }
             if vis_result["success"]:
-                result["summary"]["completed_steps"] += 1
+                completed += 1
                 logger.info("Step 3: %d개 차트 생성", len(vis_result.get("charts", [])))
             else:
-                result["summary"]["failed_steps"].append("visualize")
-                result["errors"].extend(vis_result.get("errors", []))
+                failed.append("visualize")
+                errors.extend(vis_result.get("errors", []))
         except Exception as e:
             result["steps"]["visualize"] = {"success": False, "error": str(e)}
-            result["summary"]["failed_steps"].append("visualize")
-            result["errors"].append(f"visualize 실패: {e}")
+            failed.append("visualize")
+            errors.append(f"visualize 실패: {e}")
     else:
         logger.info("Step 3: visualize 건너뜀")
 
     # ── Step 4: Review ───────────────────────────────────────────
     if not skip_review:
-        result["summary"]["total_steps"] += 1
+        total += 1
         logger.info("Step 4: review 실행 중...")
 
         try:
-            from sandoc.review import run_review
-
-            rev_result = run_review(project_dir)
+            if rev_future is not None:
+                rev_result = rev_future.result()
+            else:
+                rev_result = _call_review(project_dir)
             result["steps"]["review"] = {
                 "success": rev_result["success"],
                 "overall_score": rev_result.get("overall_score"),
                 "missing_sections": rev_result.get("missing_sections", []),
             }
             if rev_result["success"]:
-                result["summary"]["completed_steps"] += 1
-                result["summary"]["overall_score"] = rev_result.get("overall_score")
+                completed += 1
+                summary["overall_score"] = rev_result.get("overall_score")
                 logger.info("Step 4: 검토 점수 %.0f/100", rev_result.get("overall_score", 0))
             else:
-                result["summary"]["failed_steps"].append("review")
-                result["errors"].extend(rev_result.get("errors", []))
+                failed.append("review")
+                errors.extend(rev_result.get("errors", []))
         except Exception as e:
             result["steps"]["review"] = {"success": False, "error": str(e)}
-            result["summary"]["failed_steps"].append("review")
-            result["errors"].append(f"review 실패: {e}")
+            failed.append("review")
+            errors.append(f"review 실패: {e}")
     else:
         logger.info("Step 4: review 건너뜀")
 
+    if pool is not None:
+        pool.shutdown()
+
     # ── Step 5: Assemble ─────────────────────────────────────────
-    result["summary"]["total_steps"] += 1
+    total += 1
     logger.info("Step 5: assemble 실행 중...")
 
     try:
@@ -240,33 +280,80 @@ def run_pipeline(
             "html_path": asm_result.get("html_path"),
         }
         if asm_result["success"]:
-            result["summary"]["completed_steps"] += 1
-            result["summary"]["section_count"] = asm_result.get("section_count", 0)
-            result["summary"]["hwpx_path"] = asm_result.get("hwpx_path")
-            result["summary"]["html_path"] = asm_result.get("html_path")
+            completed += 1
+            summary["section_count"] = asm_result.get("section_count", 0)
+            summary["hwpx_path"] = asm_result.get("hwpx_path")
+            summary["html_path"] = asm_result.get("html_path")
             logger.info(
                 "Step 5: 조립 완료 — %d개 섹션, %d자",
                 asm_result.get("section_count", 0),
                 asm_result.get("total_chars", 0),
             )
         else:
-            result["summary"]["failed_steps"].append("assemble")
-            result["errors"].extend(asm_result.get("errors", []))
+            failed.append("assemble")
+            errors.extend(asm_result.get("errors", []))
     except Exception as e:
         result["steps"]["assemble"] = {"success": False, "error": str(e)}
-        result["summary"]["failed_steps"].append("assemble")
-        result["errors"].append(f"assemble 실패: {e}")
+        failed.append("assemble")
+        errors.append(f"assemble 실패: {e}")
 
     # ── 최종 결과 ────────────────────────────────────────────────
-    result["success"] = len(result["summary"]["failed_steps"]) == 0
+    summary["total_steps"] = total
+    summary["completed_steps"] = completed
+    result["success"] = not failed
     return result
 
 
+def _save_json(path: Path, obj: Any) -> None:
+    """파이프라인 JSON 산출물 저장.
+
+    임시 파일 + os.replace 로 원자적으로 교체하고, 내용이 그대로면 다시 쓰지 않습니다
+    (재실행 시 불필요한 쓰기와 파일 감시자 트리거 방지).
+
+    산출물은 다음 단계가 읽는 파일이므로 압축 JSON 으로 씁니다.
+    디버깅용으로 사람이 읽어야 하면 SANDOC_PRETTY_JSON=1 로 들여쓰기를 켭니다.
+    """
+    pretty = os.environ.get("SANDOC_PRETTY_JSON") == "1"
+    dump_json(path, obj, atomic=True, skip_unchanged=True, indent=pretty)
+
+
+def _has_any_md(directory: Path) -> bool:
+    """디렉토리에 .md 항목이 하나라도 있는지 확인 (첫 항목에서 바로 종료).
+
+    glob("*.md") 와 같은 기준이지만 Path 객체를 만들지 않습니다.
+    디렉토리가 없으면 False.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return any(entry.name.endswith(".md") for entry in it)
+    except OSError:
+        return False
+
+
+def _call_visualize(project_dir: Path) -> dict[str, Any]:
+    """visualize 단계 실행 (동시 실행용 작업 함수)."""
+    from sandoc.visualize import run_visualize
+
+    return run_visualize(project_dir)
+
+
+def _call_review(project_dir: Path) -> dict[str, Any]:
+    """review 단계 실행 (동시 실행용 작업 함수)."""
+    from sandoc.review import run_review
+
+    return run_review(project_dir)
+
+
 def _merge_company_info(
     project_dir: Path,
     company_info_path: Path,
+    context_obj: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """회사 정보 JSON 을 context.json 에 병합합니다."""
+    """회사 정보 JSON 을 context.json 에 병합합니다.
+
+    context_obj 가 주어지면 (같은 실행에서 extract 가 막 저장한 context)
+    context.json 을 다시 읽어 파싱하지 않고 그 객체에 병합합니다.
+    """
     merge_result: dict[str, Any] = {
         "success": False,
         "merged_fields": 0,
@@ -274,9 +361,11 @@ def _merge_company_info(
     }
 
     context_path = project_dir / "context.json"
-    if not context_path.exists():
+    if context_obj is not None:
+        context: dict[str, Any] = context_obj
+    elif not context_path.exists():
         # context.json 이 없으면 기본 구조 생성
-        context: dict[str, Any] = {
+        context = {
             "project_name": project_dir.name,
             "documents": [],
             "template_analysis": None,
@@ -287,13 +376,13 @@ def _merge_company_info(
         }
     else:
         try:
-            context = json.loads(context_path.read_text(encoding="utf-8"))
+            context = load_json(context_path)
         except (json.JSONDecodeError, OSError) as e:
             merge_result["errors"].append(f"context.json 읽기 실패: {e}")
             return merge_result
 
     try:
-        company_data = json.loads(company_info_path.read_text(encoding="utf-8"))
+        company_data = load_json(company_info_path)
     except (json.JSONDecodeError, OSError) as e:
         merge_result["errors"].append(f"company info 읽기 실패: {e}")
         return merge_result
@@ -304,24 +393,21 @@ def _merge_company_info(
     if "from_docs" not in context["company_info_found"]:
         context["company_info_found"]["from_docs"] = {}
 
-    merged = 0
-    for key, value in company_data.items():
-        if key.startswith("_"):
-            continue  # _comments 등 메타데이터 스킵
-        if value is not None and value != "" and value != [] and value != 0:
-            context["company_info_found"]["from_docs"][key] = value
-            merged += 1
+    # _comments 등 메타데이터 키와 빈 값 (None, "", 0, [], {}) 은 병합하지 않음
+    # — 목록과 비교하지 않고 진릿값으로 판단, 한 번의 update 로 반영
+    filtered = {k: v for k, v in company_data.items() if v and not k.startswith("_")}
+    context["company_info_found"]["from_docs"].update(filtered)
+    merged = len(filtered)
 
-    # missing_info 재계산
-    from sandoc.extract import _determine_missing_info
+    # missing_info 재계산 (같은 실행의 extract 결과에 병합된 필드가 없으면 그대로 사용)
+    if merged or context_obj is None or "missing_info" not in context:
+        from sandoc.extract import _determine_missing_info
 
-    found_info = context["company_info_found"]["from_docs"]
-    context["missing_info"] = _determine_missing_info(found_info)
+        found_info = context["company_info_found"]["from_docs"]
+        context["missing_info"] = _determine_missing_info(found_info)
 
     # 저장
-    context_path.write_text(
-        json.dumps(context, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    _save_json(context_path, context)
 
     # missing_info.json 업데이트
     missing_path = project_dir / "missing_info.json"
@@ -331,10 +417,7 @@ def _merge_company_info(
         "total_missing": len(context["missing_info"]),
         "instructions": "아래 항목들은 아직 미입력된 필드입니다.",
     }
-    missing_path.write_text(
-        json.dumps(missing_info_output, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _save_json(missing_path, missing_info_output)
 
     merge_result["success"] = True
     merge_result["merged_fields"] = merged
@@ -6,13 +6,15 @@ sandoc.schema — 회사 정보 스키마 및 데이터 모델
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
-from dataclasses import dataclass, field, asdict
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """팀 구성원 정보."""
     name: str = ""                   # 이름
@@ -21,16 +23,34 @@ class TeamMember:
     experience: str = ""             # 경력/역량
     employment_type: str = "기고용"   # 기고용 / 채용예정
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "name": self.name,
+            "position": self.position,
+            "role": self.role,
+            "experience": self.experience,
+            "employment_type": self.employment_type,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class InfraItem:
     """보유 인프라 항목."""
     infra_type: str = ""             # 유형 (사무실, 장비, 시설 등)
     description: str = ""            # 활용 계획
     location: str = ""               # 위치
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "infra_type": self.infra_type,
+            "description": self.description,
+            "location": self.location,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class IPItem:
     """지식재산권 항목."""
     ip_type: str = ""                # 유형 (특허, 상표, 디자인 등)
@@ -38,8 +58,17 @@ class IPItem:
     registration_no: str = ""        # 등록번호
     registration_date: str = ""      # 등록일
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "ip_type": self.ip_type,
+            "name": self.name,
+            "registration_no": self.registration_no,
+            "registration_date": self.registration_date,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class RevenueRecord:
     """매출 실적 항목."""
     target_market: str = ""          # 목표시장(고객)
@@ -49,8 +78,19 @@ class RevenueRecord:
     price: str = ""                  # 가격
     revenue: str = ""                # 발생매출액
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "target_market": self.target_market,
+            "product_service": self.product_service,
+            "entry_date": self.entry_date,
+            "volume": self.volume,
+            "price": self.price,
+            "revenue": self.revenue,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ProjectedRevenue:
     """추정 매출 항목."""
     target_market: str = ""          # 목표시장(고객)
@@ -60,16 +100,35 @@ class ProjectedRevenue:
     price: str = ""                  # 가격
     projected_sales: str = ""        # 판매금액
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "target_market": self.target_market,
+            "product_service": self.product_service,
+            "launch_date": self.launch_date,
+            "volume": self.volume,
+            "price": self.price,
+            "projected_sales": self.projected_sales,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MilestoneItem:
     """사업 추진 일정 항목."""
     task: str = ""                   # 추진내용
     period: str = ""                 # 추진기간
     details: str = ""                # 세부내용
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "task": self.task,
+            "period": self.period,
+            "details": self.details,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class BudgetItem:
     """사업비 집행 항목."""
     category: str = ""               # 비목
@@ -77,8 +136,49 @@ class BudgetItem:
     amount: int = 0                  # 금액 (원)
     source: str = "정부지원"          # 정부지원 / 자기부담(현금) / 자기부담(현물)
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "category": self.category,
+            "description": self.description,
+            "amount": self.amount,
+            "source": self.source,
+        }
+
+
+_ITEM_TYPES = (
+    TeamMember, InfraItem, IPItem, RevenueRecord, ProjectedRevenue, MilestoneItem, BudgetItem,
+)
+
+# CompanyInfo 의 중첩 목록 필드 → 항목 dataclass (from_dict 에서 dict 항목 변환용)
+_NESTED_ITEM_TYPES: dict[str, type] = {
+    "team_members": TeamMember,
+    "infrastructure": InfraItem,
+    "ip_portfolio": IPItem,
+    "revenue_records": RevenueRecord,
+    "projected_revenues": ProjectedRevenue,
+    "milestones": MilestoneItem,
+    "budget_items": BudgetItem,
+}
+
+
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    """dataclass 필드 이름 집합 (클래스별로 한 번만 계산)."""
+    return frozenset(f.name for f in fields(cls))
+
 
-@dataclass
+def _items_to_dicts(items: list[Any]) -> list[Any]:
+    """중첩 항목 목록을 dict 목록으로 변환 (알 수 없는 항목은 asdict 와 같게 처리)."""
+    return [
+        item.to_dict() if isinstance(item, _ITEM_TYPES)
+        else asdict(item) if is_dataclass(item)
+        else copy.deepcopy(item)
+        for item in items
+    ]
+
+
+@dataclass(slots=True)
 class CompanyInfo:
     """
     사업계획서 생성에 필요한 회사 정보 스키마.
@@ -155,8 +255,65 @@ class CompanyInfo:
     # ── 직렬화 ─────────────────────────────────────────────────
 
     def to_dict(self) -> dict[str, Any]:
-        """딕셔너리로 변환."""
-        return asdict(self)
+        """딕셔너리로 변환.
+
+        dataclasses.asdict 와 같은 결과를 필드별로 직접 만듭니다 (필드 탐색과
+        값마다의 deepcopy 생략). 중첩 항목 목록은 새 dict 목록으로 바꾸고,
+        JSON 에서 list/dict 로 들어온 나머지 필드 (additional_info 등) 는
+        deepcopy 하여 결과를 수정해도 인스턴스가 바뀌지 않게 합니다.
+        """
+        d = {
+            "company_name": self.company_name,
+            "ceo_name": self.ceo_name,
+            "business_registration_no": self.business_registration_no,
+            "business_type": self.business_type,
+            "ceo_type": self.ceo_type,
+            "establishment_date": self.establishment_date,
+            "employee_count": self.employee_count,
+            "address": self.address,
+            "item_name": self.item_name,
+            "item_category": self.item_category,
+            "support_field": self.support_field,
+            "tech_field": self.tech_field,
+            "item_summary": self.item_summary,
+            "product_description": self.product_description,
+            "problem_background": self.problem_background,
+            "problem_statement": self.problem_statement,
+            "development_motivation": self.development_motivation,
+            "progress_to_date": self.progress_to_date,
+            "target_market": self.target_market,
+            "target_customer": self.target_customer,
+            "competitive_advantage": self.competitive_advantage,
+            "key_features": self.key_features,
+            "competitor_analysis": self.competitor_analysis,
+            "revenue_records": _items_to_dicts(self.revenue_records),
+            "business_model": self.business_model,
+            "growth_strategy": self.growth_strategy,
+            "marketing_plan": self.marketing_plan,
+            "projected_revenues": _items_to_dicts(self.projected_revenues),
+            "milestones": _items_to_dicts(self.milestones),
+            "mid_term_roadmap": self.mid_term_roadmap,
+            "short_term_roadmap": self.short_term_roadmap,
+            "deliverables": self.deliverables,
+            "funding_amount": self.funding_amount,
+            "self_funding_cash": self.self_funding_cash,
+            "self_funding_inkind": self.self_funding_inkind,
+            "budget_items": _items_to_dicts(self.budget_items),
+            "future_funding_plan": self.future_funding_plan,
+            "success_return_type": self.success_return_type,
+            "ceo_background": self.ceo_background,
+            "team_members": _items_to_dicts(self.team_members),
+            "infrastructure": _items_to_dicts(self.infrastructure),
+            "ip_portfolio": _items_to_dicts(self.ip_portfolio),
+            "investment_amount": self.investment_amount,
+            "investment_date": self.investment_date,
+            "investor_name": self.investor_name,
+            "additional_info": self.additional_info,
+        }
+        for key, value in d.items():
+            if isinstance(value, (list, dict)) and key not in _NESTED_ITEM_TYPES:
+                d[key] = copy.deepcopy(value)
+        return d
 
     def to_json(self, indent: int = 2) -> str:
         """JSON 문자열로 변환."""
@@ -165,26 +322,17 @@ class CompanyInfo:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> CompanyInfo:
         """딕셔너리에서 CompanyInfo 생성."""
-        # 중첩 dataclass 처리
-        nested_mappings = {
-            "team_members": TeamMember,
-            "infrastructure": InfraItem,
-            "ip_portfolio": IPItem,
-            "revenue_records": RevenueRecord,
-            "projected_revenues": ProjectedRevenue,
-            "milestones": MilestoneItem,
-            "budget_items": BudgetItem,
-        }
-        processed = dict(data)
-        for field_name, cls_type in nested_mappings.items():
-            if field_name in processed and isinstance(processed[field_name], list):
-                processed[field_name] = [
-                    cls_type(**item) if isinstance(item, dict) else item
-                    for item in processed[field_name]
-                ]
-        # CompanyInfo 필드에 없는 키 제거
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in processed.items() if k in valid_fields}
+        valid_fields = _field_names(cls)
+        # 입력을 한 번만 훑으며 필드에 없는 키는 버리고 중첩 목록은 바로 변환
+        # (dict 복사 → 중첩 변환 → 필터링 세 단계를 한 단계로)
+        filtered: dict[str, Any] = {}
+        for key, value in data.items():
+            if key not in valid_fields:
+                continue
+            cls_type = _NESTED_ITEM_TYPES.get(key)
+            if cls_type is not None and isinstance(value, list):
+                value = [cls_type(**item) if isinstance(item, dict) else item for item in value]
+            filtered[key] = value
         return cls(**filtered)
 
     @classmethod
@@ -215,61 +363,103 @@ class CompanyInfo:
         """5억원 이상 투자유치 가점 대상 여부."""
         return self.investment_amount >= 500_000_000
 
+    def get_all_section_contexts(self) -> dict[str, dict[str, Any]]:
+        """모든 섹션의 컨텍스트를 {섹션명: 컨텍스트} 로 한 번에 반환.
+
+        섹션 목록은 _SECTION_CONTEXT_BUILDERS 를 그대로 따릅니다 (평가항목 순서).
+        """
+        return {name: build(self) for name, build in _SECTION_CONTEXT_BUILDERS.items()}
+
     def get_section_context(self, section_name: str) -> dict[str, Any]:
-        """특정 섹션에 필요한 컨텍스트 정보 추출."""
-        contexts = {
-            "기업개요": {
-                "company_name": self.company_name,
-                "ceo_name": self.ceo_name,
-                "establishment_date": self.establishment_date,
-                "business_type": self.business_type,
-                "employee_count": self.employee_count,
-                "item_name": self.item_name,
-                "support_field": self.support_field,
-            },
-            "문제인식": {
-                "item_name": self.item_name,
-                "problem_background": self.problem_background,
-                "problem_statement": self.problem_statement,
-                "development_motivation": self.development_motivation,
-                "progress_to_date": self.progress_to_date,
-                "product_description": self.product_description,
-            },
-            "실현가능성": {
-                "item_name": self.item_name,
-                "target_market": self.target_market,
-                "target_customer": self.target_customer,
-                "competitive_advantage": self.competitive_advantage,
-                "key_features": self.key_features,
-                "competitor_analysis": self.competitor_analysis,
-                "revenue_records": [asdict(r) for r in self.revenue_records],
-            },
-            "성장전략": {
-                "item_name": self.item_name,
-                "business_model": self.business_model,
-                "growth_strategy": self.growth_strategy,
-                "marketing_plan": self.marketing_plan,
-                "projected_revenues": [asdict(r) for r in self.projected_revenues],
-                "milestones": [asdict(m) for m in self.milestones],
-                "mid_term_roadmap": self.mid_term_roadmap,
-            },
-            "팀구성": {
-                "ceo_name": self.ceo_name,
-                "ceo_background": self.ceo_background,
-                "team_members": [asdict(t) for t in self.team_members],
-                "infrastructure": [asdict(i) for i in self.infrastructure],
-                "ip_portfolio": [asdict(ip) for ip in self.ip_portfolio],
-            },
-            "재무계획": {
-                "funding_amount": self.funding_amount,
-                "self_funding_cash": self.self_funding_cash,
-                "self_funding_inkind": self.self_funding_inkind,
-                "total_budget": self.total_budget,
-                "budget_items": [asdict(b) for b in self.budget_items],
-                "future_funding_plan": self.future_funding_plan,
-            },
+        """특정 섹션에 필요한 컨텍스트 정보 추출.
+
+        요청한 섹션의 dict 만 만듭니다 (다른 섹션의 중첩 목록은 asdict 하지 않음).
+        섹션명 → 빌더 메서드는 모듈 수준 표 (_SECTION_CONTEXT_BUILDERS) 로 한 번만 만들어
+        조회합니다. 알 수 없는 섹션이면 전체 정보를 반환합니다.
+        """
+        builder = _SECTION_CONTEXT_BUILDERS.get(section_name)
+        if builder is None:
+            return self.to_dict()
+        return builder(self)
+
+    def _overview_context(self) -> dict[str, Any]:
+        """기업개요 섹션 컨텍스트."""
+        return {
+            "company_name": self.company_name,
+            "ceo_name": self.ceo_name,
+            "establishment_date": self.establishment_date,
+            "business_type": self.business_type,
+            "employee_count": self.employee_count,
+            "item_name": self.item_name,
+            "support_field": self.support_field,
+        }
+
+    def _problem_context(self) -> dict[str, Any]:
+        """문제인식 섹션 컨텍스트."""
+        return {
+            "item_name": self.item_name,
+            "problem_background": self.problem_background,
+            "problem_statement": self.problem_statement,
+            "development_motivation": self.development_motivation,
+            "progress_to_date": self.progress_to_date,
+            "product_description": self.product_description,
+        }
+
+    def _feasibility_context(self) -> dict[str, Any]:
+        """실현가능성 섹션 컨텍스트."""
+        return {
+            "item_name": self.item_name,
+            "target_market": self.target_market,
+            "target_customer": self.target_customer,
+            "competitive_advantage": self.competitive_advantage,
+            "key_features": self.key_features,
+            "competitor_analysis": self.competitor_analysis,
+            "revenue_records": _items_to_dicts(self.revenue_records),
+        }
+
+    def _growth_context(self) -> dict[str, Any]:
+        """성장전략 섹션 컨텍스트."""
+        return {
+            "item_name": self.item_name,
+            "business_model": self.business_model,
+            "growth_strategy": self.growth_strategy,
+            "marketing_plan": self.marketing_plan,
+            "projected_revenues": _items_to_dicts(self.projected_revenues),
+            "milestones": _items_to_dicts(self.milestones),
+            "mid_term_roadmap": self.mid_term_roadmap,
         }
-        return contexts.get(section_name, self.to_dict())
+
+    def _team_context(self) -> dict[str, Any]:
+        """팀구성 섹션 컨텍스트."""
+        return {
+            "ceo_name": self.ceo_name,
+            "ceo_background": self.ceo_background,
+            "team_members": _items_to_dicts(self.team_members),
+            "infrastructure": _items_to_dicts(self.infrastructure),
+            "ip_portfolio": _items_to_dicts(self.ip_portfolio),
+        }
+
+    def _finance_context(self) -> dict[str, Any]:
+        """재무계획 섹션 컨텍스트."""
+        return {
+            "funding_amount": self.funding_amount,
+            "self_funding_cash": self.self_funding_cash,
+            "self_funding_inkind": self.self_funding_inkind,
+            "total_budget": self.total_budget,
+            "budget_items": _items_to_dicts(self.budget_items),
+            "future_funding_plan": self.future_funding_plan,
+        }
+
+
+# 섹션명 → 컨텍스트 빌더 (클래스 정의 후 한 번 구성)
+_SECTION_CONTEXT_BUILDERS = {
+    "기업개요": CompanyInfo._overview_context,
+    "문제인식": CompanyInfo._problem_context,
+    "실현가능성": CompanyInfo._feasibility_context,
+    "성장전략": CompanyInfo._growth_context,
+    "팀구성": CompanyInfo._team_context,
+    "재무계획": CompanyInfo._finance_context,
+}
 
 
 def create_sample_company() -> CompanyInfo:
@@ -7,12 +7,15 @@ HWP 파일에서 폰트, 여백, 문단 스타일을 추출하여
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from sandoc.jsonio import dump_json, dumps, load_json
 from sandoc.parser import parse_hwp, HwpParseResult
 
 logger = logging.getLogger(__name__)
@@ -20,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 # ── 데이터 클래스 ─────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class FontSpec:
     """폰트 사양."""
     name: str
@@ -28,8 +31,17 @@ class FontSpec:
     bold: bool = False
     italic: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "name": self.name,
+            "size_pt": self.size_pt,
+            "bold": self.bold,
+            "italic": self.italic,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MarginSpec:
     """여백 사양 (mm 단위)."""
     top: float = 10.0
@@ -40,26 +52,47 @@ class MarginSpec:
     footer: float = 10.0
     gutter: float = 0.0
 
-
-@dataclass
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "top": self.top,
+            "bottom": self.bottom,
+            "left": self.left,
+            "right": self.right,
+            "header": self.header,
+            "footer": self.footer,
+            "gutter": self.gutter,
+        }
+
+
+@dataclass(slots=True)
 class SectionSpec:
     """섹션(페이지) 사양."""
     paper_width_mm: float = 210.0
     paper_height_mm: float = 297.0
     margins: MarginSpec = field(default_factory=MarginSpec)
 
+    def to_dict(self) -> dict[str, Any]:
+        """딕셔너리로 변환."""
+        return {
+            "paper_width_mm": self.paper_width_mm,
+            "paper_height_mm": self.paper_height_mm,
+            "margins": self.margins.to_dict(),
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class StyleProfile:
     """
     문서 스타일 프로파일.
 
     HWP 파일에서 추출한 폰트, 여백, 섹션 정보를 담고 있으며
     JSON 으로 저장/로드할 수 있습니다.
+
+    폰트 목록은 font_names 만 저장하고, fonts 는 필요할 때 만드는 파생 속성입니다.
     """
     name: str = ""
     source_file: str = ""
-    fonts: list[FontSpec] = field(default_factory=list)
     primary_font: FontSpec = field(default_factory=lambda: FontSpec(name="함초롬바탕"))
     heading_font: FontSpec = field(default_factory=lambda: FontSpec(name="함초롬돋움", size_pt=14.0, bold=True))
     body_font: FontSpec = field(default_factory=lambda: FontSpec(name="함초롬바탕", size_pt=10.0))
@@ -68,12 +101,38 @@ class StyleProfile:
     char_shapes_count: int = 0
     font_names: list[str] = field(default_factory=list)
 
+    @property
+    def fonts(self) -> list[FontSpec]:
+        """font_names 로 만든 FontSpec 목록 (기본 크기/서식, 호출마다 새 목록)."""
+        return [FontSpec(name=n) for n in self.font_names]
+
     def to_dict(self) -> dict[str, Any]:
-        """딕셔너리로 변환."""
-        return asdict(self)
+        """딕셔너리로 변환.
+
+        필드별로 직접 만듭니다 (asdict 의 재귀 deepcopy 없음).
+        styles 는 파서가 만든 평평한 dict 목록이므로 항목 dict 만 복사합니다.
+        "fonts" 키는 StyleMirror.get_font_list 가 읽으므로 font_names 에서 만들어 유지합니다.
+        """
+        return {
+            "name": self.name,
+            "source_file": self.source_file,
+            "fonts": [f.to_dict() for f in self.fonts],
+            "primary_font": self.primary_font.to_dict(),
+            "heading_font": self.heading_font.to_dict(),
+            "body_font": self.body_font.to_dict(),
+            "sections": [s.to_dict() for s in self.sections],
+            "styles": [dict(s) for s in self.styles],
+            "char_shapes_count": self.char_shapes_count,
+            "font_names": list(self.font_names),
+        }
 
     def to_json(self, indent: int = 2) -> str:
-        """JSON 문자열로 변환."""
+        """JSON 문자열로 변환.
+
+        기본 들여쓰기(2칸)는 sandoc.jsonio (orjson 사용 가능 시 orjson) 로 직렬화합니다.
+        """
+        if indent == 2:
+            return dumps(self.to_dict()).decode("utf-8")
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
 
 
@@ -83,6 +142,9 @@ def extract_style_profile(hwp_path: str | Path) -> StyleProfile:
     """
     HWP 파일에서 스타일 프로파일을 추출합니다.
 
+    같은 파일(경로, 수정 시각, 크기가 동일)을 다시 추출하면 캐시된 결과를
+    반환하므로, 반환값은 읽기 전용으로 다뤄야 합니다.
+
     Args:
         hwp_path: HWP 파일 경로
 
@@ -90,6 +152,17 @@ def extract_style_profile(hwp_path: str | Path) -> StyleProfile:
         StyleProfile: 추출된 스타일 프로파일
     """
     hwp_path = Path(hwp_path)
+    try:
+        st = hwp_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {hwp_path}") from None
+    return _extract_style_profile_cached(str(hwp_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_style_profile_cached(path_str: str, mtime_ns: int, size: int) -> StyleProfile:
+    """(경로, mtime, 크기) 키로 캐시되는 extract_style_profile 본체."""
+    hwp_path = Path(path_str)
     parsed = parse_hwp(hwp_path)
 
     profile = StyleProfile(
@@ -99,31 +172,24 @@ def extract_style_profile(hwp_path: str | Path) -> StyleProfile:
 
     # 폰트 정보 수집
     profile.font_names = [f.name for f in parsed.fonts if f.name]
-    for font_info in parsed.fonts:
-        if font_info.name:
-            profile.fonts.append(FontSpec(name=font_info.name))
 
     # 문자 모양에서 대표 폰트/크기 추출
     if parsed.char_shapes:
         profile.char_shapes_count = len(parsed.char_shapes)
 
-        # 가장 많이 사용된 폰트 크기 → 본문 폰트
-        size_counts: dict[float, int] = {}
-        for cs in parsed.char_shapes:
-            size = cs.font_size_pt
-            size_counts[size] = size_counts.get(size, 0) + 1
+        # 가장 많이 사용된 폰트 크기 → 본문 폰트 (Counter 로 한 번에 집계)
+        size_counts = Counter(cs.font_size_pt for cs in parsed.char_shapes)
+        # 크기별 첫 문자 모양 (역순으로 덮어써서 가장 앞의 것이 남음)
+        first_cs_by_size = {cs.font_size_pt: cs for cs in reversed(parsed.char_shapes)}
 
         if size_counts:
-            # 가장 빈번한 크기 = 본문
-            body_size = max(size_counts, key=size_counts.get)  # type: ignore[arg-type]
+            # 가장 빈번한 크기 = 본문 (동률이면 먼저 나온 크기)
+            body_size = size_counts.most_common(1)[0][0]
             # 가장 큰 크기 = 제목
-            heading_size = max(size_counts.keys())
+            heading_size = max(size_counts)
 
             # 본문 폰트 설정
-            body_cs = next(
-                (cs for cs in parsed.char_shapes if cs.font_size_pt == body_size),
-                None,
-            )
+            body_cs = first_cs_by_size.get(body_size)
             if body_cs and body_cs.font_ids and profile.font_names:
                 font_idx = body_cs.font_ids[0]  # 한글 스크립트
                 if font_idx < len(profile.font_names):
@@ -136,10 +202,7 @@ def extract_style_profile(hwp_path: str | Path) -> StyleProfile:
 
             # 제목 폰트 설정
             if heading_size != body_size:
-                heading_cs = next(
-                    (cs for cs in parsed.char_shapes if cs.font_size_pt == heading_size),
-                    None,
-                )
+                heading_cs = first_cs_by_size.get(heading_size)
                 if heading_cs and heading_cs.font_ids and profile.font_names:
                     font_idx = heading_cs.font_ids[0]
                     if font_idx < len(profile.font_names):
@@ -179,6 +242,13 @@ def extract_style_profile(hwp_path: str | Path) -> StyleProfile:
 
 # ── 저장/로드 ─────────────────────────────────────────────────────
 
+# 키 유무를 dict.get 한 번으로 구분하기 위한 센티널 (None 값과 구별)
+_MISSING: Any = object()
+
+# 여백 정보가 없는 섹션용 빈 kwargs (읽기 전용으로만 사용)
+_NO_MARGINS: dict[str, float] = {}
+
+
 def save_style_profile(profile: StyleProfile, output_path: str | Path) -> Path:
     """
     스타일 프로파일을 JSON 파일로 저장합니다.
@@ -192,7 +262,8 @@ def save_style_profile(profile: StyleProfile, output_path: str | Path) -> Path:
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(profile.to_json(), encoding="utf-8")
+    # 중간 str 없이 파일에 바로 쓰고, 임시 파일 + os.replace 로 원자적으로 교체
+    dump_json(output_path, profile.to_dict(), atomic=True)
     logger.info("스타일 프로파일 저장: %s", output_path)
     return output_path
 
@@ -208,37 +279,42 @@ def load_style_profile(path: str | Path) -> StyleProfile:
         StyleProfile: 로드된 스타일 프로파일
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"스타일 프로파일 파일을 찾을 수 없습니다: {path}")
-
-    data = json.loads(path.read_text(encoding="utf-8"))
+    # exists() 로 미리 stat 하지 않고 bytes 읽기 실패를 그대로 변환
+    try:
+        data = load_json(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"스타일 프로파일 파일을 찾을 수 없습니다: {path}") from None
 
     # FontSpec 복원
-    fonts = [FontSpec(**f) for f in data.get("fonts", [])]
-    primary_font = FontSpec(**data["primary_font"]) if "primary_font" in data else FontSpec(name="함초롬바탕")
-    heading_font = FontSpec(**data["heading_font"]) if "heading_font" in data else FontSpec(name="함초롬돋움")
-    body_font = FontSpec(**data["body_font"]) if "body_font" in data else FontSpec(name="함초롬바탕")
-
-    # SectionSpec 복원
-    sections = []
-    for s in data.get("sections", []):
-        margins_data = s.get("margins", {})
-        margins = MarginSpec(**margins_data) if margins_data else MarginSpec()
-        sections.append(SectionSpec(
+    # fonts 는 font_names 에서 파생 (font_names 가 없는 예전 파일은 fonts 의 이름 사용)
+    font_names = data.get("font_names")
+    if font_names is None:
+        font_names = [f["name"] for f in data.get("fonts", []) if f.get("name")]
+    pf = data.get("primary_font", _MISSING)
+    primary_font = FontSpec(name="함초롬바탕") if pf is _MISSING else FontSpec(**pf)
+    hf = data.get("heading_font", _MISSING)
+    heading_font = FontSpec(name="함초롬돋움") if hf is _MISSING else FontSpec(**hf)
+    bf = data.get("body_font", _MISSING)
+    body_font = FontSpec(name="함초롬바탕") if bf is _MISSING else FontSpec(**bf)
+
+    # SectionSpec 복원 (margins 가 없거나 비어 있으면 기본 여백)
+    sections = [
+        SectionSpec(
             paper_width_mm=s.get("paper_width_mm", 210.0),
             paper_height_mm=s.get("paper_height_mm", 297.0),
-            margins=margins,
-        ))
+            margins=MarginSpec(**(s.get("margins") or _NO_MARGINS)),
+        )
+        for s in data.get("sections", ())
+    ]
 
     return StyleProfile(
         name=data.get("name", ""),
         source_file=data.get("source_file", ""),
-        fonts=fonts,
         primary_font=primary_font,
         heading_font=heading_font,
         body_font=body_font,
         sections=sections,
         styles=data.get("styles", []),
         char_shapes_count=data.get("char_shapes_count", 0),
-        font_names=data.get("font_names", []),
+        font_names=font_names,
     )
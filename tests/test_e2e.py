@@ -102,6 +102,37 @@ class TestCompanyInfo:
         assert isinstance(d["team_members"], list)
         assert len(d["team_members"]) == 4
 
+    def test_to_dict_matches_asdict(self):
+        """직접 만든 to_dict 가 dataclasses.asdict 와 같은 결과 (필드 순서 포함)."""
+        from dataclasses import asdict
+
+        company = create_sample_company()
+        company.additional_info = {"notes": ["메모"], "extra": {"k": 1}}
+        d = company.to_dict()
+        assert d == asdict(company)
+        assert list(d) == list(asdict(company))
+        assert d["additional_info"] is not company.additional_info
+
+    def test_to_dict_does_not_share_containers(self):
+        """to_dict 결과를 수정해도 인스턴스는 바뀌지 않음 (asdict 와 같은 복사)."""
+        company = CompanyInfo.from_dict({
+            "company_name": "(주)테스트",
+            "key_features": ["자동 제어", "원격 모니터링"],
+            "mid_term_roadmap": ["1단계", "2단계"],
+            "team_members": [{"name": "김개발"}],
+            "additional_info": {"notes": ["메모"]},
+        })
+        d = company.to_dict()
+        d["key_features"].append("추가")
+        d["mid_term_roadmap"].clear()
+        d["team_members"][0]["name"] = "변경"
+        d["additional_info"]["notes"].append("추가")
+
+        assert company.key_features == ["자동 제어", "원격 모니터링"]
+        assert company.mid_term_roadmap == ["1단계", "2단계"]
+        assert company.team_members[0].name == "김개발"
+        assert company.additional_info == {"notes": ["메모"]}
+
     def test_to_json_roundtrip(self):
         """JSON 직렬화/역직렬화 왕복."""
         company = create_sample_company()
@@ -139,6 +170,14 @@ class TestCompanyInfo:
         assert "funding_amount" in ctx
         assert "total_budget" in ctx
 
+    def test_all_section_contexts(self):
+        """모든 섹션 컨텍스트를 한 번에 추출."""
+        company = create_sample_company()
+        contexts = company.get_all_section_contexts()
+        assert list(contexts) == ["기업개요", "문제인식", "실현가능성", "성장전략", "팀구성", "재무계획"]
+        for name, ctx in contexts.items():
+            assert ctx == company.get_section_context(name)
+
     def test_empty_company(self):
         """빈 CompanyInfo 생성."""
         company = CompanyInfo()
@@ -363,10 +363,13 @@ class TestLearnModule:
         lessons_text = lessons_path.read_text(encoding="utf-8")
         assert "학습 기록" in lessons_text
 
-        # processing_history.json 확인
-        history_path = knowledge_dir / "processing_history.json"
+        # processing_history.jsonl 확인
+        history_path = knowledge_dir / "processing_history.jsonl"
         assert history_path.exists()
-        history = json.loads(history_path.read_text(encoding="utf-8"))
+        history = [
+            json.loads(line)
+            for line in history_path.read_text(encoding="utf-8").splitlines()
+        ]
         assert len(history) > 0
         assert history[0]["project"] == "test-drafts"
 
@@ -398,6 +401,45 @@ class TestLearnModule:
             assert isinstance(data, list)
             assert "type" in data[0]
 
+    def test_run_learn_migrates_legacy_history(self, project_with_drafts, tmp_path):
+        """기존 processing_history.json 은 jsonl 로 변환 후 이어서 기록."""
+        from sandoc.learn import run_learn
+
+        knowledge_dir = tmp_path / "knowledge"
+        knowledge_dir.mkdir()
+        legacy = [{"project": "old", "announcement_type": "x", "processed_at": "20250101_000000"}]
+        (knowledge_dir / "processing_history.json").write_text(
+            json.dumps(legacy, ensure_ascii=False), encoding="utf-8"
+        )
+
+        run_learn(project_with_drafts, knowledge_dir=knowledge_dir)
+        run_learn(project_with_drafts, knowledge_dir=knowledge_dir)
+
+        assert not (knowledge_dir / "processing_history.json").exists()
+        lines = (knowledge_dir / "processing_history.jsonl").read_text(
+            encoding="utf-8"
+        ).splitlines()
+        projects = [json.loads(line)["project"] for line in lines]
+        assert projects == ["old", "test-drafts", "test-drafts"]
+
+    def test_extract_sections_parallel_matches_serial(self, monkeypatch):
+        """프로세스 풀 추출 결과가 순차 추출과 동일."""
+        from sandoc import learn
+        sections = [
+            ("◦ 핵심 기능\n  - AI 자동화\n기존 대비 60% 저렴한 솔루션\n" * 20, "solution", "실현가능성"),
+            ("1. 매출 30% 이상 달성\n2. 고객 100명 확보\n3. 확대\n" * 20, "growth_strategy", "성장전략"),
+        ]
+        serial = learn._extract_sections(sections)
+        monkeypatch.setattr(learn, "_PARALLEL_MIN_CHARS", 0)
+        parallel = learn._extract_sections(sections)
+        assert parallel == serial
+        assert serial[0][0] and serial[1][2]
+
+        # fork 를 쓸 수 없는 플랫폼에서는 프로세스 풀 없이 순차 처리
+        monkeypatch.setattr(learn, "fork_context", lambda: None)
+        monkeypatch.setattr(learn, "ProcessPoolExecutor", None)
+        assert learn._extract_sections(sections) == serial
+
 
 # ═══════════════════════════════════════════════════════════════
 #  INJECT 모듈 테스트
@@ -569,6 +611,26 @@ class TestRunModule:
         assert result["steps"]["merge"]["success"] is True
         assert result["steps"]["merge"]["merged_fields"] == 3
 
+    def test_run_extract_then_merge_missing_info(self, tmp_path):
+        """extract + 병합: missing_info.json 은 병합 결과, 병합 실패 시 extract 결과."""
+        from sandoc.run import run_pipeline
+
+        project_dir = tmp_path / "extract-merge"
+        project_dir.mkdir()
+        info_path = tmp_path / "company.json"
+        info_path.write_text(json.dumps({"company_name": "(주)병합"}, ensure_ascii=False), encoding="utf-8")
+
+        run_pipeline(project_dir, company_info_path=info_path)
+        missing = json.loads((project_dir / "missing_info.json").read_text(encoding="utf-8"))
+        assert "company_name" not in missing["missing_fields"]
+        assert missing["instructions"] == "아래 항목들은 아직 미입력된 필드입니다."
+
+        (project_dir / "missing_info.json").unlink()
+        result = run_pipeline(project_dir, company_info_path=tmp_path / "없음.json")
+        assert result["steps"]["merge"]["success"] is False
+        missing = json.loads((project_dir / "missing_info.json").read_text(encoding="utf-8"))
+        assert "company_name" in missing["missing_fields"]
+
     def test_merge_company_info(self, project_with_drafts, tmp_path):
         """회사 정보 병합 함수 직접 테스트."""
         from sandoc.run import _merge_company_info
@@ -604,6 +666,70 @@ class TestRunModule:
         # 새로 생성된 context.json 확인
         assert (project_dir / "context.json").exists()
 
+    def test_atomic_json_write_keeps_old_file_on_failure(self, tmp_path):
+        """원자적 저장 중 실패하면 기존 파일이 그대로 남음."""
+        from sandoc.jsonio import dump_json
+
+        path = tmp_path / "context.json"
+        dump_json(path, {"version": 1}, atomic=True)
+        with pytest.raises(TypeError):
+            dump_json(path, {"version": object()}, atomic=True)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"version": 1}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_json_write_skipped_when_unchanged(self, tmp_path):
+        """내용이 같으면 파일을 다시 쓰지 않음."""
+        import os
+        from sandoc.jsonio import dump_json
+
+        path = tmp_path / "style-profile.json"
+        dump_json(path, {"font": "바탕"}, skip_unchanged=True)
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        dump_json(path, {"font": "바탕"}, skip_unchanged=True)
+        assert path.stat().st_mtime_ns == 1_000_000_000
+
+        dump_json(path, {"font": "돋움"}, skip_unchanged=True)
+        assert path.stat().st_mtime_ns != 1_000_000_000
+        assert json.loads(path.read_text(encoding="utf-8")) == {"font": "돋움"}
+
+    def test_pipeline_json_compact_unless_pretty(self, tmp_path, monkeypatch):
+        """파이프라인 산출물은 압축 JSON, SANDOC_PRETTY_JSON=1 이면 들여쓰기."""
+        from sandoc.run import _save_json
+
+        data = {"project_name": "압축", "sections": [1, 2]}
+        path = tmp_path / "context.json"
+
+        monkeypatch.delenv("SANDOC_PRETTY_JSON", raising=False)
+        _save_json(path, data)
+        text = path.read_text(encoding="utf-8")
+        assert "\n" not in text and " " not in text
+        assert json.loads(text) == data
+
+        monkeypatch.setenv("SANDOC_PRETTY_JSON", "1")
+        _save_json(path, data)
+        text = path.read_text(encoding="utf-8")
+        assert text == json.dumps(data, ensure_ascii=False, indent=2)
+
+    def test_merge_uses_in_memory_context(self, tmp_path):
+        """context_obj 가 주어지면 context.json 을 다시 읽지 않음."""
+        from sandoc.run import _merge_company_info
+
+        project_dir = tmp_path / "in-memory"
+        project_dir.mkdir()
+        (project_dir / "context.json").write_text("{깨진 JSON", encoding="utf-8")
+
+        info_path = tmp_path / "company.json"
+        info_path.write_text(json.dumps({"company_name": "(주)메모리"}, ensure_ascii=False), encoding="utf-8")
+
+        context = {"project_name": "in-memory", "company_info_found": {"from_docs": {}}}
+        merge_result = _merge_company_info(project_dir, info_path, context_obj=context)
+        assert merge_result["success"] is True
+
+        ctx = json.loads((project_dir / "context.json").read_text(encoding="utf-8"))
+        assert ctx["company_info_found"]["from_docs"]["company_name"] == "(주)메모리"
+
 
 # ═══════════════════════════════════════════════════════════════
 #  CLI 테스트
@@ -811,10 +937,12 @@ class TestNewCommandsIntegration:
         text = lessons_path.read_text(encoding="utf-8")
         assert "test-drafts" in text
 
-        # processing_history.json 에 기록이 있는지
-        history = json.loads(
-            (knowledge_dir / "processing_history.json").read_text(encoding="utf-8")
-        )
+        # processing_history.jsonl 에 기록이 있는지
+        history = [
+            json.loads(line)
+            for line in (knowledge_dir / "processing_history.jsonl")
+            .read_text(encoding="utf-8").splitlines()
+        ]
         assert any(h["project"] == "test-drafts" for h in history)
 
     def test_inject_produces_complete_map(self, project_with_drafts):
@@ -58,12 +58,53 @@ class TestParseHwp:
         result = parse_hwp(HWP_FILE)
         assert len(result.fonts) > 0, "HWP 에서 폰트 정보가 추출되어야 합니다"
 
+    def test_hwp_style_names(self) -> None:
+        from sandoc.parser import parse_hwp
+
+        result = parse_hwp(HWP_FILE)
+        assert result.styles, "HWP 에서 스타일이 추출되어야 합니다"
+        assert result.styles[0]["name"] == "바탕글"
+
     def test_hwp_has_sections(self) -> None:
         from sandoc.parser import parse_hwp
 
         result = parse_hwp(HWP_FILE)
         assert len(result.sections) > 0, "HWP 에서 섹션이 있어야 합니다"
 
+    def test_parse_hwp_cached_until_file_changes(self, tmp_path: Path) -> None:
+        import os
+        import shutil
+
+        from sandoc.parser import parse_hwp
+
+        copy = tmp_path / "form.hwp"
+        shutil.copyfile(HWP_FILE, copy)
+        first = parse_hwp(copy)
+        assert parse_hwp(copy) is first
+
+        st = copy.stat()
+        os.utime(copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        reparsed = parse_hwp(copy)
+        assert reparsed is not first
+        assert reparsed.full_text == first.full_text
+
+    def test_style_profile_cached_until_file_changes(self, tmp_path: Path) -> None:
+        import os
+        import shutil
+
+        from sandoc.style import extract_style_profile
+
+        copy = tmp_path / "form.hwp"
+        shutil.copyfile(HWP_FILE, copy)
+        first = extract_style_profile(copy)
+        assert extract_style_profile(copy) is first
+
+        st = copy.stat()
+        os.utime(copy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        reextracted = extract_style_profile(copy)
+        assert reextracted is not first
+        assert reextracted == first
+
     def test_hwp_page_layout(self) -> None:
         from sandoc.parser import parse_hwp
 
@@ -99,6 +140,22 @@ class TestParsePdf:
         result = parse_pdf(PDF_FILE)
         assert len(result.full_text) > 0, "PDF 에서 텍스트가 추출되어야 합니다"
 
+    def test_pdf_text_only(self) -> None:
+        from sandoc.parser import parse_pdf
+
+        result = parse_pdf(PDF_FILE, extract_tables=False, max_pages=2)
+        assert result.page_count == 2
+        assert result.tables == []
+        assert len(result.full_text) > 0
+
+    def test_pdf_parallel_pages_match_sequential(self) -> None:
+        from sandoc.parser import parse_pdf
+
+        sequential = parse_pdf(PDF_FILE, max_pages=3)
+        parallel = parse_pdf(PDF_FILE, max_pages=3, workers=2)
+        assert parallel.pages == sequential.pages
+        assert parallel.tables == sequential.tables
+
     def test_pdf_contains_keywords(self) -> None:
         from sandoc.parser import parse_pdf
 
@@ -133,6 +190,65 @@ def test_parse_any_unsupported() -> None:
         parse_any("test.xyz")
 
 
+def test_fork_context_linux_only(monkeypatch) -> None:
+    from sandoc import parallel
+
+    monkeypatch.setattr(parallel.sys, "platform", "darwin")
+    assert parallel.fork_context() is None
+
+    monkeypatch.setattr(parallel.sys, "platform", "linux")
+    ctx = parallel.fork_context()
+    assert ctx is not None and ctx.get_start_method() == "fork"
+
+
+# ── 바이너리 디코딩 테스트 ────────────────────────────────────────
+
+def test_decode_para_text_control_codes() -> None:
+    from sandoc.parser import _decode_para_text
+
+    data = (
+        "가나".encode("utf-16-le")
+        + b"\x02\x00" + b"\x00" * 14          # 인라인 컨트롤 + 14바이트 추가 데이터
+        + "A\tB\nC\x1f".encode("utf-16-le")
+        + b"\x0d\x00"                          # 문단 끝
+    )
+    assert _decode_para_text(data) == "가나A\tB\nC"
+    # 홀수 길이의 마지막 바이트는 무시
+    assert _decode_para_text("다".encode("utf-16-le") + b"\x0a") == "다"
+
+
+# ── 스타일 프로파일 테스트 ───────────────────────────────────────
+
+def test_style_profile_to_dict_matches_asdict() -> None:
+    from dataclasses import asdict
+
+    from sandoc.style import FontSpec, MarginSpec, SectionSpec, StyleProfile
+
+    profile = StyleProfile(
+        name="양식",
+        heading_font=FontSpec(name="맑은 고딕", size_pt=16.0, bold=True),
+        sections=[SectionSpec(margins=MarginSpec(top=12.5))],
+        styles=[{"name": "바탕글"}],
+        font_names=["함초롬바탕", "맑은 고딕"],
+    )
+    d = profile.to_dict()
+    # fonts 는 font_names 에서 파생되어 "fonts" 키로 유지
+    assert d.pop("fonts") == [asdict(FontSpec(name=n)) for n in profile.font_names]
+    assert d == asdict(profile)
+    assert list(d) == list(asdict(profile))
+    assert d["styles"][0] is not profile.styles[0]
+
+
+def test_style_profile_save_load_roundtrip(tmp_path) -> None:
+    from sandoc.style import StyleProfile, load_style_profile, save_style_profile
+
+    profile = StyleProfile(name="양식", font_names=["함초롬바탕", "맑은 고딕"], char_shapes_count=3)
+    path = save_style_profile(profile, tmp_path / "style-profile.json")
+    loaded = load_style_profile(path)
+    assert loaded == profile
+    assert [f.name for f in loaded.fonts] == ["함초롬바탕", "맑은 고딕"]
+
+
 # ── 에러 케이스 테스트 ────────────────────────────────────────────
 
 def test_parse_hwp_file_not_found() -> None:
@@ -142,6 +258,13 @@ def test_parse_hwp_file_not_found() -> None:
         parse_hwp("/nonexistent/file.hwp")
 
 
+def test_load_style_profile_file_not_found() -> None:
+    from sandoc.style import load_style_profile
+
+    with pytest.raises(FileNotFoundError, match="스타일 프로파일"):
+        load_style_profile("/nonexistent/style-profile.json")
+
+
 def test_parse_pdf_file_not_found() -> None:
     from sandoc.parser import parse_pdf
 
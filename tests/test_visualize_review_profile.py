@@ -456,6 +456,17 @@ class TestReviewModule:
         assert result["consistent"] is False
         assert len(result["issues"]) > 0
 
+    def test_extract_financial_numbers_label_rules(self):
+        """라벨 뒤 첫 금액만 인정, 사이에 숫자가 끼면 제외."""
+        from sandoc.review import _extract_financial_numbers
+        text = (
+            "총사업비 약 3억원 (300,000,000원)\n"
+            "정부지원금 설명" + " 없음" * 200 + "\n"
+            "정부지원금: 200,000,000원\n"
+        )
+        assert _extract_financial_numbers(text) == {"정부지원금": 200_000_000}
+        assert _extract_financial_numbers("총사업비 " * 5000) == {}
+
     def test_run_review_no_drafts(self, tmp_path):
         """초안 없음 → 오류."""
         from sandoc.review import run_review
@@ -511,6 +522,63 @@ class TestReviewModule:
         assert result["success"] is True
         assert custom.exists()
 
+    def test_run_review_cached_until_drafts_change(self, sample_project, monkeypatch):
+        """초안이 그대로면 캐시 재사용, 수정되면 다시 분석."""
+        from sandoc import review
+
+        first = review.run_review(sample_project)
+        assert first["success"] is True
+
+        def _fail(_sections):
+            raise AssertionError("캐시가 사용되지 않음")
+
+        monkeypatch.setattr(review, "_analyze_sections", _fail)
+        second = review.run_review(sample_project)
+        assert second == first
+        monkeypatch.undo()
+
+        draft = sample_project / "output" / "drafts" / "current" / "02_problem_recognition.md"
+        draft.write_text(draft.read_text(encoding="utf-8") + "\n추가 내용\n", encoding="utf-8")
+        third = review.run_review(sample_project)
+        assert third["success"] is True
+        assert (
+            third["section_scores"]["problem_recognition"]["chars"]
+            > first["section_scores"]["problem_recognition"]["chars"]
+        )
+
+    def test_run_review_cache_does_not_hide_broken_context(self, sample_project, tmp_path):
+        """깨진 context.json 은 캐시 적중 여부와 관계없이 실패, 캐시는 리뷰 파일 옆에 저장."""
+        from sandoc import review
+
+        output_path = tmp_path / "custom" / "review.md"
+        first = review.run_review(sample_project, output_path=output_path)
+        assert first["success"] is True
+        assert (output_path.parent / review._REVIEW_CACHE_NAME).exists()
+
+        (sample_project / "context.json").write_text("{깨진 JSON", encoding="utf-8")
+        second = review.run_review(sample_project, output_path=output_path)
+        assert second["success"] is False
+        assert second["errors"]
+
+    def test_run_review_cache_detects_same_size_same_mtime_edit(self, sample_project):
+        """크기와 mtime 이 같은 수정도 내용 지문으로 감지."""
+        import os
+
+        from sandoc import review
+
+        first = review.run_review(sample_project)
+        draft = sample_project / "output" / "drafts" / "current" / "02_problem_recognition.md"
+        st = draft.stat()
+        draft.write_bytes(b"x" * st.st_size)
+        os.utime(draft, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        second = review.run_review(sample_project)
+        assert second["success"] is True
+        assert (
+            second["section_scores"]["problem_recognition"]
+            != first["section_scores"]["problem_recognition"]
+        )
+
 
 # ═══════════════════════════════════════════════════════════════
 #  PROFILE-REGISTER 모듈 테스트